@@ -38,7 +38,8 @@ from src.utils.logger import setup_logging
 setup_logging(level="DEBUG", console_level="CRITICAL", log_to_file=False, log_to_console=False)
 
 try:
-    from rich.console import Console
+    from rich.console import Console, Group
+    from rich.padding import Padding
     from rich.panel import Panel
     from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
     from rich.prompt import Prompt, Confirm, IntPrompt
@@ -48,6 +49,7 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
+from src.utils.config import write_text_atomic
 from src.utils.lock_manager import ProcessLock, ProcessLockError
 
 
@@ -58,6 +60,32 @@ else:
     console = None
 
 
+# セットアップモード選択肢 -> (mode, mode_name)
+SETUP_MODES = {
+    "1": ('simple', '簡易'),
+    "2": ('standard', '標準'),
+    "3": ('full', 'フル'),
+}
+
+# 取得期間選択肢 -> 遡る日数（Noneは全期間）
+PERIOD_DAYS = {
+    "1": 7,
+    "2": 30,
+    "3": 365,
+    "4": 365 * 5,
+    "5": None,
+}
+FULL_PERIOD_FROM_DATE = "19860101"
+
+
+def _print_section(*renderables) -> None:
+    """セクションの静的表示（見出し・説明・表）を1回の描画でまとめて出力
+
+    プロンプトごとに細切れのprintを繰り返さず、末尾の空行もPaddingで付与する。
+    """
+    console.print(Padding(Group(*renderables), (0, 0, 1, 0), expand=False))
+
+
 def interactive_setup() -> dict:
     """対話形式で設定を収集"""
     if RICH_AVAILABLE:
@@ -119,8 +147,7 @@ def _save_setup_history(settings: dict, specs: list):
     SETUP_HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with open(SETUP_HISTORY_FILE, 'w', encoding='utf-8') as f:
-            json.dump(history, f, ensure_ascii=False, indent=2)
+        write_text_atomic(SETUP_HISTORY_FILE, json.dumps(history, ensure_ascii=False, indent=2))
     except IOError:
         pass  # 保存失敗しても継続
 
@@ -560,9 +587,6 @@ def _interactive_setup_rich() -> dict:
     settings = {}
 
     # データベース選択
-    console.print("[bold]0. データベース選択[/bold]")
-    console.print()
-
     db_table = Table(show_header=True, box=box.SIMPLE, padding=(0, 1))
     db_table.add_column("No", style="cyan", width=3, justify="center")
     db_table.add_column("データベース", width=12)
@@ -581,8 +605,7 @@ def _interactive_setup_rich() -> dict:
         "分析向け高速DB、SQLiteと同様に設定不要"
     )
 
-    console.print(db_table)
-    console.print()
+    _print_section("[bold]0. データベース選択[/bold]", "", db_table)
 
     db_choice = Prompt.ask(
         "選択",
@@ -598,9 +621,7 @@ def _interactive_setup_rich() -> dict:
     elif db_choice == "2":
         # PostgreSQL
         settings['db_type'] = 'postgresql'
-        console.print()
-        console.print("[cyan]PostgreSQL接続設定[/cyan]")
-        console.print()
+        _print_section("", "[cyan]PostgreSQL接続設定[/cyan]")
 
         # 接続設定の入力
         while True:
@@ -633,12 +654,13 @@ def _interactive_setup_rich() -> dict:
 
             elif status == "exists":
                 # 既存DBがある場合は選択肢を表示
-                console.print(f"[yellow]![/yellow] {message}")
-                console.print()
-                console.print("  [cyan]1)[/cyan] 既存データを保持して更新（追加インポート）")
-                console.print("  [cyan]2)[/cyan] データベースを再作成（全データ削除）")
-                console.print("  [cyan]3)[/cyan] 別のデータベース名を指定")
-                console.print()
+                _print_section(
+                    f"[yellow]![/yellow] {message}",
+                    "",
+                    "  [cyan]1)[/cyan] 既存データを保持して更新（追加インポート）",
+                    "  [cyan]2)[/cyan] データベースを再作成（全データ削除）",
+                    "  [cyan]3)[/cyan] 別のデータベース名を指定",
+                )
 
                 db_choice = Prompt.ask(
                     "選択",
@@ -678,23 +700,23 @@ def _interactive_setup_rich() -> dict:
                     continue
 
             else:  # status == "error"
-                console.print(f"[red]✗[/red] {message}")
-                console.print()
-                console.print(Panel(
-                    "[bold]PostgreSQLのインストール・設定方法[/bold]\n\n"
-                    "[cyan]1. PostgreSQLのインストール:[/cyan]\n"
-                    "   https://www.postgresql.org/download/\n\n"
-                    "[cyan]2. サービスの起動確認:[/cyan]\n"
-                    "   services.msc → postgresql-x64-XX を開始\n\n"
-                    "[cyan]3. Pythonドライバのインストール:[/cyan]\n"
-                    "   pip install pg8000",
-                    border_style="yellow",
-                ))
-                console.print()
-
-                console.print("  [cyan]1)[/cyan] 再試行")
-                console.print("  [cyan]2)[/cyan] SQLiteに切り替え")
-                console.print()
+                _print_section(
+                    f"[red]✗[/red] {message}",
+                    "",
+                    Panel(
+                        "[bold]PostgreSQLのインストール・設定方法[/bold]\n\n"
+                        "[cyan]1. PostgreSQLのインストール:[/cyan]\n"
+                        "   https://www.postgresql.org/download/\n\n"
+                        "[cyan]2. サービスの起動確認:[/cyan]\n"
+                        "   services.msc → postgresql-x64-XX を開始\n\n"
+                        "[cyan]3. Pythonドライバのインストール:[/cyan]\n"
+                        "   pip install pg8000",
+                        border_style="yellow",
+                    ),
+                    "",
+                    "  [cyan]1)[/cyan] 再試行",
+                    "  [cyan]2)[/cyan] SQLiteに切り替え",
+                )
 
                 retry_choice = Prompt.ask(
                     "選択",
@@ -718,8 +740,7 @@ def _interactive_setup_rich() -> dict:
     console.print()
 
     # サービスキーの確認（JV-Link APIで実際にチェック）
-    console.print("[bold]1. JV-Link サービスキー確認[/bold]")
-    console.print()
+    _print_section("[bold]1. JV-Link サービスキー確認[/bold]")
 
     is_valid, message = _check_jvlink_service_key()
 
@@ -739,9 +760,6 @@ def _interactive_setup_rich() -> dict:
     last_setup = _load_setup_history()
 
     # セットアップモードの選択
-    console.print("[bold]2. セットアップモード[/bold]")
-    console.print()
-
     mode_table = Table(show_header=True, box=box.SIMPLE, padding=(0, 1))
     mode_table.add_column("No", style="cyan", width=3, justify="center")
     mode_table.add_column("モード", width=6)
@@ -772,8 +790,7 @@ def _interactive_setup_rich() -> dict:
     else:
         choices = ["1", "2", "3"]
 
-    console.print(mode_table)
-    console.print()
+    _print_section("[bold]2. セットアップモード[/bold]", "", mode_table)
 
     choice = Prompt.ask(
         "選択",
@@ -784,22 +801,11 @@ def _interactive_setup_rich() -> dict:
     today = datetime.now()
     settings['to_date'] = today.strftime("%Y%m%d")
 
-    if choice == "1":
-        settings['mode'] = 'simple'
-        settings['mode_name'] = '簡易'
-    elif choice == "2":
-        settings['mode'] = 'standard'
-        settings['mode_name'] = '標準'
-    elif choice == "3":
-        settings['mode'] = 'full'
-        settings['mode_name'] = 'フル'
+    if choice in SETUP_MODES:
+        settings['mode'], settings['mode_name'] = SETUP_MODES[choice]
 
     # 更新モード以外は期間選択
     if choice in ["1", "2", "3"]:
-        console.print()
-        console.print("[bold cyan]取得期間を選択してください[/bold cyan]")
-        console.print()
-
         # モードに応じた所要時間の見積もり（簡易=1.0, 標準=1.5, フル=2.5倍）
         time_multiplier = {"1": 1.0, "2": 1.5, "3": 2.5}[choice]
 
@@ -830,8 +836,7 @@ def _interactive_setup_rich() -> dict:
         period_table.add_row("5", "全期間", "[dim]1986年〜[/dim]", format_time(960))
         period_table.add_row("6", "カスタム", "[dim]日付を指定[/dim]", "[dim]期間による[/dim]")
 
-        console.print(period_table)
-        console.print()
+        _print_section("", "[bold cyan]取得期間を選択してください[/bold cyan]", "", period_table)
 
         period_choice = Prompt.ask(
             "選択",
@@ -839,22 +844,19 @@ def _interactive_setup_rich() -> dict:
             default="3"
         )
 
-        if period_choice == "1":
-            settings['from_date'] = (today - timedelta(days=7)).strftime("%Y%m%d")
-        elif period_choice == "2":
-            settings['from_date'] = (today - timedelta(days=30)).strftime("%Y%m%d")
-        elif period_choice == "3":
-            settings['from_date'] = (today - timedelta(days=365)).strftime("%Y%m%d")
-        elif period_choice == "4":
-            settings['from_date'] = (today - timedelta(days=365*5)).strftime("%Y%m%d")
-        elif period_choice == "5":
-            settings['from_date'] = "19860101"
+        if period_choice in PERIOD_DAYS:
+            days = PERIOD_DAYS[period_choice]
+            settings['from_date'] = (
+                FULL_PERIOD_FROM_DATE if days is None
+                else (today - timedelta(days=days)).strftime("%Y%m%d")
+            )
         else:
             # カスタム日付入力
-            console.print()
-            console.print("[bold cyan]開始日を入力してください[/bold cyan]")
-            console.print("[dim]形式: YYYY-MM-DD または YYYYMMDD (例: 2020-01-01)[/dim]")
-            console.print()
+            _print_section(
+                "",
+                "[bold cyan]開始日を入力してください[/bold cyan]",
+                "[dim]形式: YYYY-MM-DD または YYYYMMDD (例: 2020-01-01)[/dim]",
+            )
 
             while True:
                 from_input = Prompt.ask("開始日", default="2020-01-01")
@@ -939,28 +941,26 @@ def _interactive_setup_rich() -> dict:
     console.print()
 
     # 時系列オッズ取得オプション
-    console.print("[bold]3. 時系列オッズ（オッズ変動履歴）[/bold]")
-    console.print()
-    console.print(Panel(
-        "[bold]時系列オッズ（オッズ変動履歴）について[/bold]\n\n"
-        "発売開始から締切までのオッズ推移を記録するデータです。\n"
-        "例: 発売開始時10倍 → 締切時3倍 のような変化を追跡できます。\n\n"
-        "[cyan]取得条件:[/cyan]\n"
-        "  - 公式サポート期間: 過去1年間\n"
-        "  - TS_O1〜O6テーブルに保存されます\n\n"
-        "[yellow]注: 1年以上前のデータも保存されている場合がありますが、\n"
-        "公式サポート外のため取得できない可能性があります。[/yellow]\n\n"
-        "[dim]時系列オッズ取得には回次・日次情報（NL_RA）が必要です。\n"
-        "NL_RAが不足している場合は、必要な期間のRACEデータを自動取得します。[/dim]",
-        border_style="blue",
-    ))
-    console.print()
+    _print_section(
+        "[bold]3. 時系列オッズ（オッズ変動履歴）[/bold]",
+        "",
+        Panel(
+            "[bold]時系列オッズ（オッズ変動履歴）について[/bold]\n\n"
+            "発売開始から締切までのオッズ推移を記録するデータです。\n"
+            "例: 発売開始時10倍 → 締切時3倍 のような変化を追跡できます。\n\n"
+            "[cyan]取得条件:[/cyan]\n"
+            "  - 公式サポート期間: 過去1年間\n"
+            "  - TS_O1〜O6テーブルに保存されます\n\n"
+            "[yellow]注: 1年以上前のデータも保存されている場合がありますが、\n"
+            "公式サポート外のため取得できない可能性があります。[/yellow]\n\n"
+            "[dim]時系列オッズ取得には回次・日次情報（NL_RA）が必要です。\n"
+            "NL_RAが不足している場合は、必要な期間のRACEデータを自動取得します。[/dim]",
+            border_style="blue",
+        ),
+    )
     settings['include_timeseries'] = Confirm.ask("時系列オッズを取得しますか？", default=False)
     if settings['include_timeseries']:
         # 期間選択
-        console.print()
-        console.print("[cyan]取得期間を選択してください:[/cyan]")
-
         ts_period_table = Table(show_header=True, box=box.SIMPLE, padding=(0, 1))
         ts_period_table.add_column("No", style="cyan", width=3, justify="center")
         ts_period_table.add_column("期間", width=15)
@@ -972,8 +972,7 @@ def _interactive_setup_rich() -> dict:
         ts_period_table.add_row("4", "過去12ヶ月", "[dim]1年分（公式サポート期間）[/dim]")
         ts_period_table.add_row("5", "カスタム", "[yellow]任意の期間を指定（公式サポート外の可能性あり）[/yellow]")
 
-        console.print(ts_period_table)
-        console.print()
+        _print_section("", "[cyan]取得期間を選択してください:[/cyan]", ts_period_table)
 
         ts_choice = Prompt.ask("期間を選択", choices=["1", "2", "3", "4", "5"], default="2")
 
@@ -981,10 +980,11 @@ def _interactive_setup_rich() -> dict:
             # カスタム期間入力
             today = datetime.now()
 
-            console.print()
-            console.print("[yellow]カスタム期間を指定します[/yellow]")
-            console.print("[dim]注: 1年以上前のデータは公式サポート外です。取得できない場合があります。[/dim]")
-            console.print()
+            _print_section(
+                "",
+                "[yellow]カスタム期間を指定します[/yellow]",
+                "[dim]注: 1年以上前のデータは公式サポート外です。取得できない場合があります。[/dim]",
+            )
 
             while True:
                 ts_from_input = Prompt.ask("開始日 (YYYY-MM-DD)", default=(today - timedelta(days=90)).strftime("%Y-%m-%d"))
@@ -1036,30 +1036,33 @@ def _interactive_setup_rich() -> dict:
     console.print()
 
     # 速報系データの取得
-    console.print("[bold]4. 当日レース情報の取得[/bold]")
-    console.print("[dim]レース当日に更新される情報を取得します。[/dim]")
-    console.print("[dim]含まれる情報: 馬体重、出走取消、騎手変更、天候・馬場状態など[/dim]")
-    console.print()
+    _print_section(
+        "[bold]4. 当日レース情報の取得[/bold]",
+        "[dim]レース当日に更新される情報を取得します。[/dim]",
+        "[dim]含まれる情報: 馬体重、出走取消、騎手変更、天候・馬場状態など[/dim]",
+    )
     settings['include_realtime'] = Confirm.ask("当日レース情報を取得しますか？", default=False)
     console.print()
 
     # バックグラウンド更新
-    console.print("[bold]5. 自動更新サービス[/bold]")
-    console.print("[dim]データを自動で最新に保つバックグラウンドサービスです。[/dim]")
-    console.print("[dim]起動しておくと、新しいレース情報やオッズが自動的にDBに追加されます。[/dim]")
-    console.print()
+    _print_section(
+        "[bold]5. 自動更新サービス[/bold]",
+        "[dim]データを自動で最新に保つバックグラウンドサービスです。[/dim]",
+        "[dim]起動しておくと、新しいレース情報やオッズが自動的にDBに追加されます。[/dim]",
+    )
 
     # 既存のバックグラウンドプロセスをチェック
     is_running, running_pid = _check_background_updater_running()
     auto_start_enabled = _is_auto_start_enabled()
 
     if is_running:
-        console.print(f"[yellow]注意: バックグラウンド更新が既に起動中です (PID: {running_pid})[/yellow]")
-        console.print()
-        console.print("  [cyan]1)[/cyan] そのまま継続（新しく起動しない）")
-        console.print("  [cyan]2)[/cyan] 停止して新しく起動する")
-        console.print("  [cyan]3)[/cyan] 停止のみ（起動しない）")
-        console.print()
+        _print_section(
+            f"[yellow]注意: バックグラウンド更新が既に起動中です (PID: {running_pid})[/yellow]",
+            "",
+            "  [cyan]1)[/cyan] そのまま継続（新しく起動しない）",
+            "  [cyan]2)[/cyan] 停止して新しく起動する",
+            "  [cyan]3)[/cyan] 停止のみ（起動しない）",
+        )
 
         bg_choice = Prompt.ask(
             "選択",
@@ -1091,12 +1094,11 @@ def _interactive_setup_rich() -> dict:
 
     # 自動起動設定（バックグラウンドが有効または継続の場合のみ）
     if settings.get('enable_background') or settings.get('keep_existing_background'):
-        console.print("[bold]6. Windows起動時の自動起動[/bold]")
-        if auto_start_enabled:
-            console.print("[dim]現在: [green]有効[/green] (Windowsスタートアップに登録済み)[/dim]")
-        else:
-            console.print("[dim]現在: [yellow]無効[/yellow][/dim]")
-        console.print()
+        _print_section(
+            "[bold]6. Windows起動時の自動起動[/bold]",
+            "[dim]現在: [green]有効[/green] (Windowsスタートアップに登録済み)[/dim]"
+            if auto_start_enabled else "[dim]現在: [yellow]無効[/yellow][/dim]",
+        )
 
         if auto_start_enabled:
             if not Confirm.ask("自動起動を維持しますか？", default=True):
@@ -1131,8 +1133,6 @@ def _interactive_setup_rich() -> dict:
         console.print()
 
     # 確認
-    console.print(Panel("[bold]設定確認[/bold]", border_style="blue"))
-
     confirm_table = Table(show_header=False, box=None, padding=(0, 1))
     confirm_table.add_column("Key", style="dim")
     confirm_table.add_column("Value", style="white")
@@ -1156,8 +1156,7 @@ def _interactive_setup_rich() -> dict:
     if settings.get('auto_start'):
         confirm_table.add_row("PC起動時に自動起動", "[green]有効[/green]")
 
-    console.print(confirm_table)
-    console.print()
+    _print_section(Panel("[bold]設定確認[/bold]", border_style="blue"), confirm_table)
 
     if not Confirm.ask("[bold]この設定でセットアップを開始しますか？[/bold]", default=True):
         console.print("[yellow]キャンセルしました[/yellow]")
@@ -1333,15 +1332,8 @@ def _interactive_setup_simple() -> dict:
     today = datetime.now()
     settings['to_date'] = today.strftime("%Y%m%d")
 
-    if choice == "1":
-        settings['mode'] = 'simple'
-        settings['mode_name'] = '簡易'
-    elif choice == "2":
-        settings['mode'] = 'standard'
-        settings['mode_name'] = '標準'
-    elif choice == "3":
-        settings['mode'] = 'full'
-        settings['mode_name'] = 'フル'
+    if choice in SETUP_MODES:
+        settings['mode'], settings['mode_name'] = SETUP_MODES[choice]
 
     # 更新モード以外は期間選択
     if choice in ["1", "2", "3"]:
@@ -1371,16 +1363,12 @@ def _interactive_setup_simple() -> dict:
         if period_choice not in ["1", "2", "3", "4", "5", "6"]:
             period_choice = "3"
 
-        if period_choice == "1":
-            settings['from_date'] = (today - timedelta(days=7)).strftime("%Y%m%d")
-        elif period_choice == "2":
-            settings['from_date'] = (today - timedelta(days=30)).strftime("%Y%m%d")
-        elif period_choice == "3":
-            settings['from_date'] = (today - timedelta(days=365)).strftime("%Y%m%d")
-        elif period_choice == "4":
-            settings['from_date'] = (today - timedelta(days=365*5)).strftime("%Y%m%d")
-        elif period_choice == "5":
-            settings['from_date'] = "19860101"
+        if period_choice in PERIOD_DAYS:
+            days = PERIOD_DAYS[period_choice]
+            settings['from_date'] = (
+                FULL_PERIOD_FROM_DATE if days is None
+                else (today - timedelta(days=days)).strftime("%Y%m%d")
+            )
         else:
             # カスタム日付入力
             print()
@@ -1786,6 +1774,9 @@ class QuickstartRunner:
             'specs_skipped': 0,     # 契約外などでスキップ
             'specs_failed': 0,      # 実際のエラー
         }
+        # スペック取得間で共有する設定・テーブル作成状態
+        self._config = None
+        self._tables_ensured = False
         # データベースパス設定
         db_path_setting = settings.get('db_path')
         if db_path_setting:
@@ -1951,17 +1942,20 @@ class QuickstartRunner:
         return not has_error
 
     def _get_specs_for_mode(self) -> list:
-        """モードに応じたスペックリストを取得（蓄積系のみ）"""
+        """モードに応じたスペックリストを取得（蓄積系のみ）
+
+        クラス定義のリストをコピーせずに返すため、呼び出し側で変更しないこと。
+        """
         mode = self.settings.get('mode', 'simple')
         if mode == 'simple':
-            specs = self.SIMPLE_SPECS.copy()
+            specs = self.SIMPLE_SPECS
         elif mode == 'standard':
-            specs = self.STANDARD_SPECS.copy()
+            specs = self.STANDARD_SPECS
         elif mode == 'update':
             # 更新モード: UPDATE_SPECSを使用（option=2で今週データのみ）
-            specs = self.UPDATE_SPECS.copy()
+            specs = self.UPDATE_SPECS
         else:  # full
-            specs = self.FULL_SPECS.copy()
+            specs = self.FULL_SPECS
 
         # --no-odds: オッズ系スペック(O1-O6)を除外
         if self.settings.get('no_odds'):
@@ -3087,19 +3081,23 @@ class QuickstartRunner:
         # option=4非対応スペックはoption=1で実行（差分データ）
 
         try:
-            # 設定読み込み
-            from src.utils.config import load_config
-            config = load_config(str(self.project_root / "config" / "config.yaml"))
+            # 設定読み込み（全スペックで共通のため初回のみ）
+            if self._config is None:
+                from src.utils.config import load_config
+                self._config = load_config(str(self.project_root / "config" / "config.yaml"))
+            config = self._config
 
             # データベース接続
             database = self._create_database()
 
             with database:
-                # テーブル作成（必要に応じて）
-                try:
-                    create_all_tables(database)
-                except Exception:
-                    pass  # 既存テーブルがあってもOK
+                # テーブル作成（初回スペックのみ）
+                if not self._tables_ensured:
+                    try:
+                        create_all_tables(database)
+                    except Exception:
+                        pass  # 既存テーブルがあってもOK
+                    self._tables_ensured = True
 
                 # BatchProcessorを直接呼び出し（show_progress=Trueでリッチ進捗表示）
                 processor = BatchProcessor(
@@ -3110,12 +3108,13 @@ class QuickstartRunner:
                     show_progress=True,  # JVLinkProgressDisplayを有効化
                 )
 
-                # データ取得実行
+                # データ取得実行（テーブルは作成済み）
                 result = processor.process_date_range(
                     data_spec=spec,
                     from_date=self.settings['from_date'],
                     to_date=self.settings['to_date'],
                     option=option,
+                    ensure_tables=False,
                 )
 
                 # 結果をdetailsに反映
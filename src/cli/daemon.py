@@ -0,0 +1,364 @@
+"""Long-running command daemon for the JLTSQL CLI.
+
+``jltsql daemon`` keeps one Python process alive with the CLI modules already
+imported. ``jltsql-client <command> ...`` forwards its arguments to the daemon,
+which runs the command in-process and streams the output back, so repeated
+invocations skip interpreter startup and import time.
+
+Commands are executed one at a time (JV-Link allows a single session per
+process). When no daemon is running, the client runs the command locally.
+
+The socket and its authentication key live in a directory only the current
+user can access, and clients check its owner before connecting, so another
+user cannot impersonate the daemon or read the forwarded environment.
+"""
+
+import io
+import os
+import sys
+import traceback
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import click
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Environment variables forwarded from the client: the CLI's own settings
+# and the variables config.yaml expands (${JVLINK_SERVICE_KEY}, ...)
+FORWARDED_ENV_PREFIXES = ("JLTSQL_", "JVLINK_", "POSTGRES_", "PG", "OPENROUTER_")
+
+
+def _check_private(path: Path) -> None:
+    """Check that a path is owned by and only accessible to the current user.
+
+    Raises:
+        click.ClickException: If another user owns the path or can access it
+    """
+    if sys.platform == "win32":
+        return
+    st = os.lstat(path)
+    if st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise click.ClickException(
+            f"Refusing to use {path}: it must be owned by and private to the current user"
+        )
+
+
+def _runtime_dir() -> Path:
+    """Get the private per-user directory for the daemon socket and key.
+
+    Uses ``$XDG_RUNTIME_DIR/jltsql`` when available, otherwise
+    ``~/.cache/jltsql/run``. The directory is created with mode 0700.
+    """
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime and sys.platform != "win32":
+        directory = Path(runtime) / "jltsql"
+    else:
+        directory = Path.home() / ".cache" / "jltsql" / "run"
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    _check_private(directory)
+    return directory
+
+
+def default_address() -> str:
+    """Get the per-user daemon address.
+
+    Returns:
+        Named pipe path on Windows, UNIX socket path in the runtime
+        directory elsewhere
+    """
+    if sys.platform == "win32":
+        user = os.environ.get("USERNAME", "default")
+        return rf"\\.\pipe\jltsql-{user}"
+    return str(_runtime_dir() / "daemon.sock")
+
+
+def _authkey_path(address: str) -> Path:
+    """Get the authentication key file for a daemon address."""
+    if sys.platform == "win32":
+        return _runtime_dir() / "daemon.key"
+    return Path(f"{address}.key")
+
+
+def _write_authkey(address: str) -> bytes:
+    """Create a fresh authentication key readable only by the current user."""
+    authkey = os.urandom(32)
+    path = _authkey_path(address)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(authkey)
+    return authkey
+
+
+def _read_authkey(address: str) -> bytes:
+    """Read the daemon's authentication key after checking its owner.
+
+    Raises:
+        OSError: If the key file does not exist (no daemon)
+        click.ClickException: If the key file is not private
+    """
+    path = _authkey_path(address)
+    _check_private(path)
+    return path.read_bytes()
+
+
+def _connect(address: Optional[str]):
+    """Connect to the daemon after checking who owns its socket.
+
+    Raises:
+        OSError: If no daemon is listening at the address
+        click.ClickException: If the socket or key is not private
+    """
+    address = address or default_address()
+    if sys.platform != "win32":
+        _check_private(Path(address).parent)
+        if os.stat(address).st_uid != os.getuid():
+            raise click.ClickException(f"Refusing to use {address}: owned by another user")
+    return Client(address, authkey=_read_authkey(address))
+
+
+def _client_env() -> Dict[str, str]:
+    """Get the environment variables to forward to the daemon."""
+    return {
+        name: value for name, value in os.environ.items()
+        if name.startswith(FORWARDED_ENV_PREFIXES)
+    }
+
+
+class _ConnectionWriter(io.TextIOBase):
+    """Text stream that forwards everything written to the client."""
+
+    def __init__(self, conn, stream: str):
+        self._conn = conn
+        self._stream = stream
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if text:
+            self._conn.send({self._stream: text})
+        return len(text)
+
+
+@contextmanager
+def _client_context(request: dict):
+    """Run a request in the client's working directory and environment.
+
+    Forwarded variables (FORWARDED_ENV_PREFIXES) replace the daemon's own;
+    everything else in the daemon's environment is left as is.
+
+    Relative paths (``--config``, ``--output``, the default database files)
+    then resolve as they would for a local run. stdin is replaced by an
+    empty stream, so prompts abort instead of reading the daemon's terminal.
+    """
+    old_cwd = os.getcwd()
+    old_environ = dict(os.environ)
+    old_stdin = sys.stdin
+    try:
+        if request.get("cwd"):
+            os.chdir(request["cwd"])
+        if request.get("env") is not None:
+            for name in [n for n in os.environ if n.startswith(FORWARDED_ENV_PREFIXES)]:
+                del os.environ[name]
+            os.environ.update({
+                name: value for name, value in request["env"].items()
+                if name.startswith(FORWARDED_ENV_PREFIXES)
+            })
+        sys.stdin = io.StringIO("")
+        yield
+    finally:
+        sys.stdin = old_stdin
+        os.environ.clear()
+        os.environ.update(old_environ)
+        os.chdir(old_cwd)
+
+
+def _run_command(cli_command: click.Command, argv: List[str]) -> int:
+    """Run a CLI command in-process and return its exit code."""
+    try:
+        result = cli_command.main(
+            args=argv, prog_name="jltsql", standalone_mode=False, obj={}
+        )
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        print(e.code, file=sys.stderr)
+        return 1
+    except click.exceptions.Abort:
+        print("Aborted!", file=sys.stderr)
+        return 1
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except Exception:
+        # Report unexpected errors to the client and keep serving
+        sys.stderr.write(traceback.format_exc())
+        return 1
+
+    return result if isinstance(result, int) else 0
+
+
+def _remove_stale_socket(address: str) -> None:
+    """Remove a UNIX socket left behind by a daemon that did not shut down."""
+    if sys.platform == "win32" or not os.path.exists(address):
+        return
+    try:
+        Client(address).close()
+    except OSError:
+        os.unlink(address)
+    else:
+        raise click.ClickException(f"Daemon already running at {address}")
+
+
+def serve(cli_command: click.Command, address: Optional[str] = None) -> None:
+    """Serve CLI commands until a shutdown request or Ctrl+C.
+
+    Each request is ``{"argv": [...], "cwd": path, "env": {...}}``; the
+    command runs in the client's directory and environment with no stdin.
+    Output is sent back as
+    ``{"stdout": text}`` / ``{"stderr": text}`` messages followed by
+    ``{"exit": code}``. A ``{"shutdown": True}`` request stops the daemon.
+
+    Args:
+        cli_command: Click command (group) to dispatch requests to
+        address: Listener address (default: default_address())
+    """
+    address = address or default_address()
+    if sys.platform != "win32":
+        _check_private(Path(address).parent)
+    _remove_stale_socket(address)
+
+    # Restrict the socket and key to the current user
+    old_umask = os.umask(0o077) if sys.platform != "win32" else None
+    try:
+        authkey = _write_authkey(address)
+        listener = Listener(address, authkey=authkey)
+    finally:
+        if old_umask is not None:
+            os.umask(old_umask)
+
+    logger.info("Daemon listening", address=address)
+
+    with listener:
+        while True:
+            try:
+                conn = listener.accept()
+            except (AuthenticationError, OSError, EOFError) as e:
+                # Client without the key, or one that hung up during the handshake
+                logger.warning(f"Daemon rejected connection: {e}")
+                continue
+
+            with conn:
+                try:
+                    request = conn.recv()
+                except EOFError:
+                    continue
+
+                if request.get("shutdown"):
+                    conn.send({"exit": 0})
+                    break
+
+                argv = list(request.get("argv", []))
+                if argv[:1] == ["daemon"]:
+                    conn.send({"stderr": "Error: daemon cannot be started from a client\n"})
+                    conn.send({"exit": 1})
+                    continue
+
+                cwd = request.get("cwd")
+                if cwd and not os.path.isdir(cwd):
+                    conn.send({"stderr": f"Error: working directory not found: {cwd}\n"})
+                    conn.send({"exit": 1})
+                    continue
+
+                logger.info("Daemon request", argv=argv, cwd=cwd)
+                try:
+                    with _client_context(request), \
+                            redirect_stdout(_ConnectionWriter(conn, "stdout")), \
+                            redirect_stderr(_ConnectionWriter(conn, "stderr")):
+                        code = _run_command(cli_command, argv)
+                    conn.send({"exit": code})
+                except (BrokenPipeError, ConnectionResetError, EOFError):
+                    # Client went away mid-command
+                    logger.warning("Daemon client disconnected", argv=argv)
+
+    try:
+        _authkey_path(address).unlink()
+    except OSError:
+        pass
+    logger.info("Daemon stopped", address=address)
+
+
+def send_command(argv: List[str], address: Optional[str] = None) -> int:
+    """Run a command on the daemon, echoing its output locally.
+
+    Args:
+        argv: CLI arguments (without the program name)
+        address: Daemon address (default: default_address())
+
+    Returns:
+        Exit code of the command (1 if the daemon goes away mid-command)
+
+    Raises:
+        OSError: If no daemon is listening at the address
+        click.ClickException: If the socket or key is not private
+    """
+    with _connect(address) as conn:
+        try:
+            conn.send({"argv": argv, "cwd": os.getcwd(), "env": _client_env()})
+            while True:
+                message = conn.recv()
+                if "exit" in message:
+                    return message["exit"]
+                if "stdout" in message:
+                    sys.stdout.write(message["stdout"])
+                    sys.stdout.flush()
+                if "stderr" in message:
+                    sys.stderr.write(message["stderr"])
+                    sys.stderr.flush()
+        except (EOFError, OSError) as e:
+            # Connected, so the command may have started: do not rerun it locally
+            sys.stderr.write(f"Error: lost connection to the jltsql daemon ({str(e) or type(e).__name__})\n")
+            return 1
+
+
+def shutdown(address: Optional[str] = None) -> None:
+    """Ask a running daemon to exit.
+
+    Args:
+        address: Daemon address (default: default_address())
+
+    Raises:
+        OSError: If no daemon is listening at the address
+        click.ClickException: If the socket or key is not private
+    """
+    with _connect(address) as conn:
+        conn.send({"shutdown": True})
+        conn.recv()
+
+
+def client_main() -> None:
+    """Entry point for ``jltsql-client``.
+
+    Falls back to running the command in this process when the daemon is
+    not running.
+    """
+    argv = sys.argv[1:]
+    try:
+        code = send_command(argv)
+    except click.ClickException as e:
+        e.show()
+        sys.exit(e.exit_code)
+    except (OSError, AuthenticationError):
+        from src.cli.main import cli
+
+        cli.main(args=argv, prog_name="jltsql", obj={})
+        return
+    sys.exit(code)
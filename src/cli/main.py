@@ -1,21 +1,167 @@
 """JLTSQL Command Line Interface."""
 
+import functools
+import importlib
+import json
 import sys
 from pathlib import Path
 
 import click
-from rich.console import Console
 
-from src.utils.config import ConfigError, load_config
-from src.utils.logger import get_logger, setup_logging_from_config
+from src.utils.logger import get_logger
 
 # Version
 __version__ = "0.1.0-alpha"
 
-# Console for rich output (Windows cp932-safe)
-console = Console(legacy_windows=True)
+# Subcommands that never touch the configuration file
+CONFIG_FREE_COMMANDS = frozenset({"version", "status", "daemon"})
+
+# Minimum number of tables for which create-tables shows a spinner
+CREATE_TABLES_SPINNER_MIN = 20
+
+
+@functools.lru_cache(maxsize=None)
+def _get_console():
+    """Get the shared Rich console, creating it on first use (Windows cp932-safe)."""
+    from rich.console import Console
+
+    return Console(legacy_windows=True)
+
+
+def _say(*objects, **kwargs):
+    """Print an informational message unless --quiet was given."""
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None and (ctx.find_root().obj or {}).get("quiet"):
+        return
+    console.print(*objects, **kwargs)
+
+
+class _LazyConsole:
+    """Proxy that defers Rich console creation until something is printed."""
+
+    def __getattr__(self, name):
+        return getattr(_get_console(), name)
+
+
+# Console for rich output
+console = _LazyConsole()
 logger = get_logger(__name__)
 
+# Database handler (module, class) for each --db choice
+_DATABASE_HANDLERS = {
+    "sqlite": ("src.database.sqlite_handler", "SQLiteDatabase"),
+    "postgresql": ("src.database.postgresql_handler", "PostgreSQLDatabase"),
+    "duckdb": ("src.database.duckdb_handler", "DuckDBDatabase"),
+}
+
+
+# Connected handlers kept between commands while serving 'jltsql daemon'
+# (None outside the daemon: every command opens its own connection)
+_database_cache = None
+
+# Only server databases are kept open: DuckDB and SQLite hold file locks
+# while connected, which would block other tools between commands
+_REUSABLE_DATABASES = frozenset({"postgresql"})
+
+
+def _enable_database_reuse():
+    """Keep database connections open between commands in this process."""
+    global _database_cache
+    if _database_cache is None:
+        _database_cache = {}
+
+
+def _close_cached_databases():
+    """Disconnect all handlers kept open by _enable_database_reuse()."""
+    global _database_cache
+    for database in (_database_cache or {}).values():
+        try:
+            database.disconnect()
+        except Exception as e:
+            logger.warning(f"Failed to close cached database: {e}")
+    _database_cache = None
+
+
+def _connection_alive(database):
+    """Check that a cached handler's connection still answers.
+
+    A handler that is not connected counts as alive (``with database:``
+    connects it). A connection the server has dropped is closed so the
+    caller can create a fresh handler.
+    """
+    if not database.is_connected():
+        return True
+    try:
+        database.fetch_one("SELECT 1")
+        database.rollback()
+        return True
+    except Exception as e:
+        logger.warning(f"Cached database connection lost, reconnecting: {e}")
+        try:
+            database.disconnect()
+        except Exception:
+            pass
+        return False
+
+
+def _make_database(db_type, config, duckdb_memory_limit=None, duckdb_threads=None, reuse=True):
+    """Create a database handler, importing only the requested backend.
+
+    Exits with an error message if the database type is unsupported or
+    PostgreSQL is requested without a configuration file.
+
+    When database reuse is enabled (in 'jltsql daemon'), PostgreSQL handlers
+    are cached by configuration and keep their connection open between
+    commands, so ``with database:`` skips reconnecting. A cached connection
+    is checked with ``SELECT 1`` before reuse and replaced if it is dead.
+
+    Args:
+        db_type: Database type (sqlite, postgresql, duckdb)
+        config: Loaded Config object, or None
+        duckdb_memory_limit: DuckDB memory limit override (e.g., '2GB')
+        duckdb_threads: DuckDB thread count override
+        reuse: Allow a cached handler (False for handlers used by
+               background threads that outlive the command)
+
+    Returns:
+        Database handler instance (connected only if reused)
+    """
+    if db_type not in _DATABASE_HANDLERS:
+        console.print(f"[red]Error:[/red] Unsupported database type: {db_type}")
+        sys.exit(1)
+
+    if db_type == "postgresql":
+        if not config:
+            console.print("[red]Error:[/red] PostgreSQL requires configuration file.")
+            sys.exit(1)
+        db_config = config.get("databases.postgresql")
+    elif db_type == "duckdb":
+        db_config = config.get("databases.duckdb") if config else {"path": "data/keiba.duckdb"}
+        # Apply DuckDB-specific options if provided
+        if duckdb_memory_limit is not None:
+            db_config["memory_limit"] = duckdb_memory_limit
+        if duckdb_threads is not None:
+            db_config["threads"] = duckdb_threads
+    else:
+        db_config = config.get("databases.sqlite") if config else {"path": "data/keiba.db"}
+
+    cache_key = None
+    if reuse and _database_cache is not None and db_type in _REUSABLE_DATABASES:
+        cache_key = (db_type, json.dumps(db_config, sort_keys=True, default=str))
+        cached = _database_cache.pop(cache_key, None)
+        if cached is not None and _connection_alive(cached):
+            _database_cache[cache_key] = cached
+            return cached
+
+    module_name, class_name = _DATABASE_HANDLERS[db_type]
+    handler_class = getattr(importlib.import_module(module_name), class_name)
+    database = handler_class(db_config)
+
+    if cache_key is not None:
+        database.keep_alive = True
+        _database_cache[cache_key] = database
+    return database
+
 
 @click.group()
 @click.option(
@@ -31,9 +177,15 @@ logger = get_logger(__name__)
     is_flag=True,
     help="Enable verbose output (DEBUG level)",
 )
+@click.option(
+    "--quiet",
+    "-q",
+    is_flag=True,
+    help="Suppress informational banners (errors and results are still shown)",
+)
 @click.version_option(version=__version__, prog_name="jrvltsql")
 @click.pass_context
-def cli(ctx, config, verbose):
+def cli(ctx, config, verbose, quiet):
     """JRVLTSQL - JRA-VAN Link To SQL
 
     JRA-VAN DataLabの競馬データをSQLite/PostgreSQL/DuckDBに
@@ -49,6 +201,15 @@ def cli(ctx, config, verbose):
     """
     # Store context
     ctx.ensure_object(dict)
+    ctx.obj["quiet"] = quiet
+
+    # Fast path: commands like version/status need no config or logging setup
+    if ctx.invoked_subcommand in CONFIG_FREE_COMMANDS:
+        ctx.obj["config"] = None
+        return
+
+    from src.utils.config import ConfigError, load_config
+    from src.utils.logger import setup_logging_from_config
 
     # Load configuration
     if config:
@@ -131,9 +292,9 @@ def init(ctx, force):
         )
     else:
         if config_example.exists():
-            import shutil
+            from src.utils.config import write_text_atomic
 
-            shutil.copy(config_example, config_yaml)
+            write_text_atomic(config_yaml, config_example.read_text(encoding="utf-8"))
             console.print(f"[green]+[/green] Created configuration file: {config_yaml}")
         else:
             console.print(
@@ -163,10 +324,53 @@ def version():
     console.print("Python version: " + sys.version.split()[0])
 
 
+@cli.command()
+@click.option("--address", default=None, help="Socket/pipe address (default: per-user)")
+@click.option("--stop", "stop_daemon", is_flag=True, help="Stop the running daemon")
+def daemon(address, stop_daemon):
+    """Run a long-lived process that executes jltsql-client commands.
+
+    \b
+    Examples:
+      jltsql daemon                # Start serving (Ctrl+C to stop)
+      jltsql-client fetch --from 20240101 --to 20241231 --spec RACE
+      jltsql daemon --stop         # Stop the running daemon
+    """
+    from src.cli import daemon as daemon_mod
+
+    address = address or daemon_mod.default_address()
+
+    if stop_daemon:
+        try:
+            daemon_mod.shutdown(address)
+        except OSError:
+            console.print(f"[yellow]No daemon running at {address}[/yellow]")
+            sys.exit(1)
+        console.print("[green]Daemon stopped.[/green]")
+        return
+
+    console.print(f"[bold green]Daemon listening on {address}[/bold green]")
+    console.print("Press Ctrl+C to stop.\n")
+    # Keep database connections open between client commands
+    _enable_database_reuse()
+    try:
+        daemon_mod.serve(cli, address)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Daemon stopped.[/yellow]")
+    finally:
+        _close_cached_databases()
+
+
 @cli.command()
 @click.option("--from", "date_from", required=True, help="Start date (YYYYMMDD)")
 @click.option("--to", "date_to", required=True, help="End date (YYYYMMDD) - filters records up to this date")
-@click.option("--spec", "data_spec", required=True, help="Data specification (RACE, DIFF, etc.)")
+@click.option(
+    "--spec",
+    "--specs",
+    "data_spec",
+    required=True,
+    help="Data specification, comma-separated for several (RACE, DIFF, RACE,DIFF, etc.)",
+)
 @click.option(
     "--option",
     "jv_option",
@@ -192,6 +396,9 @@ def fetch(ctx, date_from, date_to, data_spec, jv_option, db, duckdb_memory_limit
     The --to parameter filters records client-side to only import
     records with dates up to and including the --to date.
 
+    Several data specs can be given as a comma-separated list; they are
+    fetched in order over a single database connection and JV-Link session.
+
     \b
     Examples:
       # 通常データ取得（差分データ）
@@ -202,11 +409,10 @@ def fetch(ctx, date_from, date_to, data_spec, jv_option, db, duckdb_memory_limit
 
       # セットアップ（全データ取得）
       jltsql fetch --from 20240101 --to 20241231 --spec DIFF --option 3
+
+      # 複数データ種別をまとめて取得
+      jltsql fetch --from 20240101 --to 20241231 --specs RACE,DIFF,BLOD --option 4
     """
-    from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
-    from src.database.sqlite_handler import SQLiteDatabase
-    from src.database.postgresql_handler import PostgreSQLDatabase
-    from src.database.duckdb_handler import DuckDBDatabase
     from src.database.schema import create_all_tables
     from src.importer.batch import BatchProcessor
 
@@ -221,50 +427,35 @@ def fetch(ctx, date_from, date_to, data_spec, jv_option, db, duckdb_memory_limit
     else:
         db_type = config.get("database.type", "sqlite")
 
+    data_specs = [spec.strip() for spec in data_spec.split(",") if spec.strip()]
+
     option_names = {1: "通常データ", 2: "今週データ", 3: "セットアップ", 4: "分割セットアップ"}
-    console.print(f"[bold cyan]Fetching historical data from JRA-VAN...[/bold cyan]\n")
-    console.print(f"  Date range: {date_from} -- {date_to}")
-    console.print(f"  Data spec:  {data_spec}")
-    console.print(f"  Option:     {jv_option} ({option_names.get(jv_option, '不明')})")
-    console.print(f"  Database:   {db_type}")
+    _say(f"[bold cyan]Fetching historical data from JRA-VAN...[/bold cyan]\n")
+    _say(f"  Date range: {date_from} -- {date_to}")
+    _say(f"  Data spec:  {', '.join(data_specs)}")
+    _say(f"  Option:     {jv_option} ({option_names.get(jv_option, '不明')})")
+    _say(f"  Database:   {db_type}")
 
     # Warn if setup mode (3 or 4) is used
     if jv_option in (3, 4):
-        console.print()
-        console.print("[yellow]Note:[/yellow] セットアップモード - 全データ取得（ダイアログが表示されます）")
+        _say()
+        _say("[yellow]Note:[/yellow] セットアップモード - 全データ取得（ダイアログが表示されます）")
 
     # Validate data_spec and option combination
     from src.jvlink.constants import is_valid_jvopen_combination, JVOPEN_VALID_COMBINATIONS
-    if not is_valid_jvopen_combination(data_spec, jv_option):
-        console.print()
-        console.print(f"[red]Error:[/red] データ種別 '{data_spec}' は option={jv_option} では取得できません")
-        valid_specs = JVOPEN_VALID_COMBINATIONS.get(jv_option, [])
-        console.print(f"       option={jv_option} で取得可能: {', '.join(valid_specs)}")
-        sys.exit(1)
+    for spec in data_specs:
+        if not is_valid_jvopen_combination(spec, jv_option):
+            console.print()
+            console.print(f"[red]Error:[/red] データ種別 '{spec}' は option={jv_option} では取得できません")
+            valid_specs = JVOPEN_VALID_COMBINATIONS.get(jv_option, [])
+            console.print(f"       option={jv_option} で取得可能: {', '.join(valid_specs)}")
+            sys.exit(1)
 
-    console.print()
+    _say()
 
     try:
         # Initialize database
-        if db_type == "sqlite":
-            db_config = config.get("databases.sqlite") if config else {"path": "data/keiba.db"}
-            database = SQLiteDatabase(db_config)
-        elif db_type == "postgresql":
-            if not config:
-                console.print("[red]Error:[/red] PostgreSQL requires configuration file.")
-                sys.exit(1)
-            database = PostgreSQLDatabase(config.get("databases.postgresql"))
-        elif db_type == "duckdb":
-            db_config = config.get("databases.duckdb") if config else {"path": "data/keiba.duckdb"}
-            # Apply DuckDB-specific options if provided
-            if duckdb_memory_limit is not None:
-                db_config["memory_limit"] = duckdb_memory_limit
-            if duckdb_threads is not None:
-                db_config["threads"] = duckdb_threads
-            database = DuckDBDatabase(db_config)
-        else:
-            console.print(f"[red]Error:[/red] Unsupported database type: {db_type}")
-            sys.exit(1)
+        database = _make_database(db_type, config, duckdb_memory_limit, duckdb_threads)
 
         # Connect to database
         with database:
@@ -287,23 +478,31 @@ def fetch(ctx, date_from, date_to, data_spec, jv_option, db, duckdb_memory_limit
             if not progress:
                 console.print("[bold]Processing data...[/bold]")
 
-            result = processor.process_date_range(
-                data_spec=data_spec,
-                from_date=date_from,
-                to_date=date_to,
-                option=jv_option
-            )
+            # One processor (and JV-Link session) is reused for every spec
+            results = {}
+            for spec in data_specs:
+                results[spec] = processor.process_date_range(
+                    data_spec=spec,
+                    from_date=date_from,
+                    to_date=date_to,
+                    option=jv_option,
+                    ensure_tables=False,
+                )
 
             # Show results
             console.print()
             console.print("[bold green][OK] Fetch complete![/bold green]")
-            console.print()
-            console.print("[bold]Statistics:[/bold]")
-            console.print(f"  Fetched:  {result['records_fetched']}")
-            console.print(f"  Parsed:   {result['records_parsed']}")
-            console.print(f"  Imported: {result['records_imported']}")
-            console.print(f"  Failed:   {result['records_failed']}")
-            console.print(f"  Batches:  {result.get('batches_processed', 0)}")
+            for spec, result in results.items():
+                console.print()
+                if len(results) > 1:
+                    console.print(f"[bold]Statistics ({spec}):[/bold]")
+                else:
+                    console.print("[bold]Statistics:[/bold]")
+                console.print(f"  Fetched:  {result['records_fetched']}")
+                console.print(f"  Parsed:   {result['records_parsed']}")
+                console.print(f"  Imported: {result['records_imported']}")
+                console.print(f"  Failed:   {result['records_failed']}")
+                console.print(f"  Batches:  {result.get('batches_processed', 0)}")
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Interrupted by user[/yellow]")
@@ -331,9 +530,6 @@ def monitor(ctx, daemon, data_spec, interval, db, duckdb_memory_limit, duckdb_th
       jltsql monitor --daemon               # Run in background
       jltsql monitor --spec RACE --interval 30
     """
-    from src.database.sqlite_handler import SQLiteDatabase
-    from src.database.postgresql_handler import PostgreSQLDatabase
-    from src.database.duckdb_handler import DuckDBDatabase
     from src.database.schema import create_all_tables
     from src.realtime.monitor import RealtimeMonitor
 
@@ -348,34 +544,16 @@ def monitor(ctx, daemon, data_spec, interval, db, duckdb_memory_limit, duckdb_th
     else:
         db_type = config.get("database.type", "sqlite")
 
-    console.print(f"[bold cyan]Starting real-time monitoring...[/bold cyan]\n")
-    console.print(f"  Data spec:  {data_spec}")
-    console.print(f"  Interval:   {interval}s")
-    console.print(f"  Database:   {db_type}")
-    console.print(f"  Mode:       {'daemon' if daemon else 'foreground'}")
-    console.print()
+    _say(f"[bold cyan]Starting real-time monitoring...[/bold cyan]\n")
+    _say(f"  Data spec:  {data_spec}")
+    _say(f"  Interval:   {interval}s")
+    _say(f"  Database:   {db_type}")
+    _say(f"  Mode:       {'daemon' if daemon else 'foreground'}")
+    _say()
 
     try:
         # Initialize database
-        if db_type == "sqlite":
-            db_config = config.get("databases.sqlite") if config else {"path": "data/keiba.db"}
-            database = SQLiteDatabase(db_config)
-        elif db_type == "postgresql":
-            if not config:
-                console.print("[red]Error:[/red] PostgreSQL requires configuration file.")
-                sys.exit(1)
-            database = PostgreSQLDatabase(config.get("databases.postgresql"))
-        elif db_type == "duckdb":
-            db_config = config.get("databases.duckdb") if config else {"path": "data/keiba.duckdb"}
-            # Apply DuckDB-specific options if provided
-            if duckdb_memory_limit is not None:
-                db_config["memory_limit"] = duckdb_memory_limit
-            if duckdb_threads is not None:
-                db_config["threads"] = duckdb_threads
-            database = DuckDBDatabase(db_config)
-        else:
-            console.print(f"[red]Error:[/red] Unsupported database type: {db_type}")
-            sys.exit(1)
+        database = _make_database(db_type, config, duckdb_memory_limit, duckdb_threads, reuse=False)
 
         # Connect to database
         with database:
@@ -405,15 +583,20 @@ def monitor(ctx, daemon, data_spec, interval, db, duckdb_memory_limit, duckdb_th
                 status = monitor_obj.get_status()
                 console.print(f"Started at: {status['started_at']}")
             else:
-                # Foreground mode - wait for Ctrl+C
+                # Foreground mode - block until Ctrl+C instead of polling.
+                # Ctrl+C interrupts time.sleep at once, so a long sleep
+                # costs no wakeups
+                import time
+
                 try:
-                    import time
                     while True:
-                        time.sleep(1)
+                        time.sleep(3600)
                 except KeyboardInterrupt:
-                    console.print("\n[yellow]Stopping monitor...[/yellow]")
-                    monitor_obj.stop()
-                    console.print("[green]Monitor stopped.[/green]")
+                    pass
+
+                console.print("\n[yellow]Stopping monitor...[/yellow]")
+                monitor_obj.stop()
+                console.print("[green]Monitor stopped.[/green]")
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Interrupted by user[/yellow]")
@@ -450,11 +633,14 @@ def create_tables(ctx, db, duckdb_memory_limit, duckdb_threads, create_all, nl_o
       jltsql create-tables --nl-only      # Create only NL_* tables
       jltsql create-tables --rt-only      # Create only RT_* tables
     """
-    from rich.progress import Progress, TextColumn
-    from src.database.schema import SCHEMAS, create_all_tables
-    from src.database.sqlite_handler import SQLiteDatabase
-    from src.database.postgresql_handler import PostgreSQLDatabase
-    from src.database.duckdb_handler import DuckDBDatabase
+    from src.database.schema import (
+        NL_TABLE_NAMES,
+        NL_TABLE_SET,
+        RT_TABLE_NAMES,
+        RT_TABLE_SET,
+        SCHEMAS,
+        SchemaManager,
+    )
 
     config = ctx.obj.get("config")
     if not config and not db:
@@ -467,61 +653,40 @@ def create_tables(ctx, db, duckdb_memory_limit, duckdb_threads, create_all, nl_o
     else:
         db_type = config.get("database.type", "sqlite")
 
-    console.print(f"[bold cyan]Creating database tables ({db_type})...[/bold cyan]\n")
+    _say(f"[bold cyan]Creating database tables ({db_type})...[/bold cyan]\n")
 
     try:
         # Initialize database
-        if db_type == "sqlite":
-            db_config = config.get("databases.sqlite") if config else {"path": "data/keiba.db"}
-            database = SQLiteDatabase(db_config)
-        elif db_type == "postgresql":
-            if not config:
-                console.print("[red]Error:[/red] PostgreSQL requires configuration file.")
-                sys.exit(1)
-            database = PostgreSQLDatabase(config.get("databases.postgresql"))
-        elif db_type == "duckdb":
-            db_config = config.get("databases.duckdb") if config else {"path": "data/keiba.duckdb"}
-            # Apply DuckDB-specific options if provided
-            if duckdb_memory_limit is not None:
-                db_config["memory_limit"] = duckdb_memory_limit
-            if duckdb_threads is not None:
-                db_config["threads"] = duckdb_threads
-            database = DuckDBDatabase(db_config)
-        else:
-            console.print(f"[red]Error:[/red] Unsupported database type: {db_type}")
-            sys.exit(1)
+        database = _make_database(db_type, config, duckdb_memory_limit, duckdb_threads)
 
         # Connect to database
         with database:
             # Determine which tables to create
             if nl_only:
-                tables_to_create = {name: sql for name, sql in SCHEMAS.items() if name.startswith("NL_")}
+                tables_to_create = NL_TABLE_NAMES
             elif rt_only:
-                tables_to_create = {name: sql for name, sql in SCHEMAS.items() if name.startswith("RT_")}
+                tables_to_create = RT_TABLE_NAMES
             else:
-                tables_to_create = SCHEMAS
-
-            # Create tables with progress bar
-            created_count = 0
-            failed_count = 0
-
-            with Progress(
-                TextColumn("[progress.description]{task.description}"),
-                console=console
-            ) as progress:
-                task = progress.add_task(f"[cyan]Creating {len(tables_to_create)} tables...", total=len(tables_to_create))
-
-                for table_name, schema_sql in tables_to_create.items():
-                    progress.update(task, description=f"[cyan]Creating {table_name}...")
-
-                    try:
-                        database.execute(schema_sql)
-                        created_count += 1
-                    except Exception as e:
-                        console.print(f"[yellow]Warning:[/yellow] Failed to create {table_name}: {e}")
-                        failed_count += 1
+                tables_to_create = tuple(SCHEMAS)
+
+            # Create all tables in one batch; a spinner is only worth its
+            # redraws when there are enough tables for the wait to be noticeable
+            schema_manager = SchemaManager(database)
+            if len(tables_to_create) >= CREATE_TABLES_SPINNER_MIN:
+                with console.status(
+                    f"[cyan]Creating {len(tables_to_create)} tables...",
+                    refresh_per_second=4,
+                ):
+                    results = schema_manager.create_tables(list(tables_to_create))
+            else:
+                results = schema_manager.create_tables(list(tables_to_create))
 
-                    progress.advance(task)
+            failed_tables = [name for name, ok in results.items() if not ok]
+            for table_name in failed_tables:
+                error = schema_manager.errors.get(table_name, "unknown error")
+                console.print(f"[yellow]Warning:[/yellow] Failed to create {table_name}: {error}")
+            created_count = len(results) - len(failed_tables)
+            failed_count = len(failed_tables)
 
             # Show results
             console.print()
@@ -530,8 +695,8 @@ def create_tables(ctx, db, duckdb_memory_limit, duckdb_threads, create_all, nl_o
                 console.print(f"[yellow][!!][/yellow] Failed to create {failed_count} tables")
 
             # Show table statistics
-            nl_tables = len([n for n in tables_to_create if n.startswith("NL_")])
-            rt_tables = len([n for n in tables_to_create if n.startswith("RT_")])
+            nl_tables = len(NL_TABLE_SET.intersection(tables_to_create))
+            rt_tables = len(RT_TABLE_SET.intersection(tables_to_create))
 
             console.print()
             console.print("[bold]Table Statistics:[/bold]")
@@ -568,9 +733,6 @@ def create_indexes(ctx, db, duckdb_memory_limit, duckdb_threads, table):
       jltsql create-indexes --table NL_RA      # Create indexes for NL_RA only
     """
     from src.database.indexes import IndexManager
-    from src.database.sqlite_handler import SQLiteDatabase
-    from src.database.postgresql_handler import PostgreSQLDatabase
-    from src.database.duckdb_handler import DuckDBDatabase
 
     config = ctx.obj.get("config")
     if not config and not db:
@@ -583,29 +745,11 @@ def create_indexes(ctx, db, duckdb_memory_limit, duckdb_threads, table):
     else:
         db_type = config.get("database.type", "sqlite")
 
-    console.print(f"[bold cyan]Creating database indexes ({db_type})...[/bold cyan]\n")
+    _say(f"[bold cyan]Creating database indexes ({db_type})...[/bold cyan]\n")
 
     try:
         # Initialize database
-        if db_type == "sqlite":
-            db_config = config.get("databases.sqlite") if config else {"path": "data/keiba.db"}
-            database = SQLiteDatabase(db_config)
-        elif db_type == "postgresql":
-            if not config:
-                console.print("[red]Error:[/red] PostgreSQL requires configuration file.")
-                sys.exit(1)
-            database = PostgreSQLDatabase(config.get("databases.postgresql"))
-        elif db_type == "duckdb":
-            db_config = config.get("databases.duckdb") if config else {"path": "data/keiba.duckdb"}
-            # Apply DuckDB-specific options if provided
-            if duckdb_memory_limit is not None:
-                db_config["memory_limit"] = duckdb_memory_limit
-            if duckdb_threads is not None:
-                db_config["threads"] = duckdb_threads
-            database = DuckDBDatabase(db_config)
-        else:
-            console.print(f"[red]Error:[/red] Unsupported database type: {db_type}")
-            sys.exit(1)
+        database = _make_database(db_type, config, duckdb_memory_limit, duckdb_threads)
 
         # Connect to database
         with database:
@@ -683,9 +827,6 @@ def export(ctx, table, output_format, output, where, db, duckdb_memory_limit, du
       jltsql export --table NL_HR --format parquet --output payouts.parquet
     """
     from pathlib import Path
-    from src.database.sqlite_handler import SQLiteDatabase
-    from src.database.postgresql_handler import PostgreSQLDatabase
-    from src.database.duckdb_handler import DuckDBDatabase
 
     config = ctx.obj.get("config")
     if not config and not db:
@@ -708,25 +849,7 @@ def export(ctx, table, output_format, output, where, db, duckdb_memory_limit, du
 
     try:
         # Initialize database
-        if db_type == "sqlite":
-            db_config = config.get("databases.sqlite") if config else {"path": "data/keiba.db"}
-            database = SQLiteDatabase(db_config)
-        elif db_type == "postgresql":
-            if not config:
-                console.print("[red]Error:[/red] PostgreSQL requires configuration file.")
-                sys.exit(1)
-            database = PostgreSQLDatabase(config.get("databases.postgresql"))
-        elif db_type == "duckdb":
-            db_config = config.get("databases.duckdb") if config else {"path": "data/keiba.duckdb"}
-            # Apply DuckDB-specific options if provided
-            if duckdb_memory_limit is not None:
-                db_config["memory_limit"] = duckdb_memory_limit
-            if duckdb_threads is not None:
-                db_config["threads"] = duckdb_threads
-            database = DuckDBDatabase(db_config)
-        else:
-            console.print(f"[red]Error:[/red] Unsupported database type: {db_type}")
-            sys.exit(1)
+        database = _make_database(db_type, config, duckdb_memory_limit, duckdb_threads)
 
         # Connect and export
         with database:
@@ -755,9 +878,10 @@ def export(ctx, table, output_format, output, where, db, duckdb_memory_limit, du
 
             # Fetch data
             from rich.progress import Progress, TextColumn
+
             with Progress(
                 TextColumn("[progress.description]{task.description}"),
-                console=console
+                console=_get_console()
             ) as progress:
                 task = progress.add_task("[cyan]Fetching data...", total=None)
                 rows = database.fetch_all(sql)
@@ -963,9 +1087,6 @@ def start(ctx, specs, db, duckdb_memory_limit, duckdb_threads, batch_size, no_cr
       jltsql realtime start --specs 0B12,0B15
       jltsql realtime start --specs 0B12 --db sqlite
     """
-    from src.database.sqlite_handler import SQLiteDatabase
-    from src.database.postgresql_handler import PostgreSQLDatabase
-    from src.database.duckdb_handler import DuckDBDatabase
     from src.services.realtime_monitor import RealtimeMonitor
 
     config = ctx.obj.get("config")
@@ -994,25 +1115,7 @@ def start(ctx, specs, db, duckdb_memory_limit, duckdb_threads, batch_size, no_cr
 
     try:
         # Initialize database
-        if db_type == "sqlite":
-            db_config = config.get("databases.sqlite") if config else {"path": "data/keiba.db"}
-            database = SQLiteDatabase(db_config)
-        elif db_type == "postgresql":
-            if not config:
-                console.print("[red]Error:[/red] PostgreSQL requires configuration file.")
-                sys.exit(1)
-            database = PostgreSQLDatabase(config.get("databases.postgresql"))
-        elif db_type == "duckdb":
-            db_config = config.get("databases.duckdb") if config else {"path": "data/keiba.duckdb"}
-            # Apply DuckDB-specific options if provided
-            if duckdb_memory_limit is not None:
-                db_config["memory_limit"] = duckdb_memory_limit
-            if duckdb_threads is not None:
-                db_config["threads"] = duckdb_threads
-            database = DuckDBDatabase(db_config)
-        else:
-            console.print(f"[red]Error:[/red] Unsupported database type: {db_type}")
-            sys.exit(1)
+        database = _make_database(db_type, config, duckdb_memory_limit, duckdb_threads, reuse=False)
 
         # Create monitor
         monitor = RealtimeMonitor(
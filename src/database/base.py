@@ -50,6 +50,9 @@ class BaseDatabase(ABC):
         self.config = config
         self._connection = None
         self._cursor = None
+        # Keep the connection open after the outermost ``with`` block exits
+        self.keep_alive = False
+        self._context_depth = 0
         logger.info(f"{self.__class__.__name__} initialized")
 
     def _quote_identifier(self, identifier: str) -> str:
@@ -173,6 +176,36 @@ class BaseDatabase(ABC):
         """
         pass
 
+    @abstractmethod
+    def list_tables(self) -> List[str]:
+        """Get the names of all tables in one query.
+
+        Returns:
+            List of table names
+        """
+        pass
+
+    def execute_script(self, statements: List[str]) -> None:
+        """Execute several parameterless statements (e.g. DDL) as one batch.
+
+        The default implementation runs the statements one by one.
+        Subclasses override this to send them in a single round-trip
+        and/or transaction.
+
+        Args:
+            statements: SQL statements without parameters
+
+        Raises:
+            DatabaseError: If any statement fails
+        """
+        for sql in statements:
+            self.execute(sql)
+
+    @staticmethod
+    def _join_statements(statements: List[str]) -> str:
+        """Join SQL statements into one script separated by semicolons."""
+        return ";\n".join(sql.strip().rstrip(";") for sql in statements) + ";"
+
     def insert(self, table_name: str, data: Dict[str, Any], use_replace: bool = True) -> int:
         """Insert single row into table.
 
@@ -302,17 +335,29 @@ class BaseDatabase(ABC):
         pass
 
     def __enter__(self):
-        """Context manager entry."""
-        self.connect()
+        """Context manager entry.
+
+        Connects unless already connected, so nested blocks and
+        keep_alive handlers reuse the open connection.
+        """
+        if not self.is_connected():
+            self.connect()
+        self._context_depth += 1
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
+        """Context manager exit.
+
+        Commits (or rolls back) the block's work. The connection is closed
+        when the outermost block exits, unless keep_alive is set.
+        """
+        self._context_depth = max(0, self._context_depth - 1)
         if exc_type is not None:
             self.rollback()
         else:
             self.commit()
-        self.disconnect()
+        if self._context_depth == 0 and not self.keep_alive:
+            self.disconnect()
 
     def __repr__(self) -> str:
         """String representation."""
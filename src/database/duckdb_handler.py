@@ -35,6 +35,12 @@ class DuckDBDatabase(BaseDatabase):
         ...     db.insert("test", {"id": 1})
     """
 
+    # Batches of at least this many rows use the columnar insert path
+    COLUMNAR_INSERT_MIN_ROWS = 50
+
+    # Name under which a batch DataFrame is registered for INSERT ... SELECT
+    _COLUMNAR_VIEW = "_jltsql_insert_batch"
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize DuckDB database handler.
 
@@ -165,6 +171,22 @@ class DuckDBDatabase(BaseDatabase):
                     logger.warning(f"Rollback failed: {rollback_error}")
             raise DatabaseError(f"SQL execution failed: {e}")
 
+    def execute_script(self, statements: List[str]) -> None:
+        """Execute several parameterless statements in one transaction.
+
+        DuckDB accepts multiple statements per call, so the whole batch is
+        sent at once inside BEGIN/COMMIT instead of one commit per statement.
+
+        Args:
+            statements: SQL statements without parameters
+
+        Raises:
+            DatabaseError: If any statement fails
+        """
+        if not statements:
+            return
+        self.execute(f"BEGIN TRANSACTION;\n{self._join_statements(statements)}\nCOMMIT;")
+
     def executemany(self, sql: str, parameters_list: List[tuple]) -> int:
         """Execute SQL statement with multiple parameter sets.
 
@@ -307,6 +329,15 @@ class DuckDBDatabase(BaseDatabase):
         except DatabaseError:
             return False
 
+    def list_tables(self) -> List[str]:
+        """Get the names of all tables in one query.
+
+        Returns:
+            List of table names
+        """
+        rows = self.fetch_all("SELECT table_name FROM information_schema.tables")
+        return [row["table_name"] for row in rows]
+
     def get_table_info(self, table_name: str) -> List[Dict[str, Any]]:
         """Get table schema information.
 
@@ -433,6 +464,61 @@ class DuckDBDatabase(BaseDatabase):
                     pass
             raise
 
+    def _insert_columnar(
+        self,
+        table_name: str,
+        columns: List[str],
+        data_list: List[Dict[str, Any]],
+        pk_columns: List[str],
+    ) -> int:
+        """Insert rows as one INSERT ... SELECT over a column-oriented DataFrame.
+
+        executemany() runs the INSERT once per row; here the rows are pivoted
+        into one list per column, wrapped in a pandas DataFrame (object dtype,
+        so missing values stay NULL instead of becoming NaN) and inserted with
+        a single statement that DuckDB executes vectorized.
+
+        Args:
+            table_name: Target table name
+            columns: Column names (taken from the first row)
+            data_list: Rows to insert
+            pk_columns: Primary key columns for UPSERT, empty for plain INSERT
+
+        Returns:
+            Number of rows in the batch
+
+        Raises:
+            ImportError: If pandas is not installed
+            Exception: If DuckDB rejects the insert (caller falls back)
+        """
+        import pandas as pd
+
+        frame = pd.DataFrame(
+            {col: [row.get(col) for row in data_list] for col in columns},
+            dtype=object,
+        )
+        if pk_columns:
+            # One statement cannot update the same row twice; the last one wins
+            # as it would with row-by-row UPSERT
+            frame = frame.drop_duplicates(subset=pk_columns, keep="last")
+
+        quoted_columns = ", ".join(self._quote_identifier(col) for col in columns)
+        sql = f"INSERT INTO {table_name} ({quoted_columns}) SELECT {quoted_columns} FROM {self._COLUMNAR_VIEW}"
+        if pk_columns:
+            conflict_target = ", ".join(self._quote_identifier(col) for col in pk_columns)
+            update_clause = ", ".join(
+                f"{self._quote_identifier(col)} = EXCLUDED.{self._quote_identifier(col)}"
+                for col in columns
+            )
+            sql += f" ON CONFLICT ({conflict_target}) DO UPDATE SET {update_clause}"
+
+        self._connection.register(self._COLUMNAR_VIEW, frame)
+        try:
+            self._connection.execute(sql)
+        finally:
+            self._connection.unregister(self._COLUMNAR_VIEW)
+        return len(data_list)
+
     def insert_many(self, table_name: str, data_list: List[Dict[str, Any]], use_replace: bool = True) -> int:
         """Insert multiple rows into a table.
 
@@ -475,6 +561,15 @@ class DuckDBDatabase(BaseDatabase):
         else:
             sql = f'INSERT INTO {table_name} ({", ".join(quoted_columns)}) VALUES ({placeholders})'
 
+        # Fast path: hand DuckDB the batch column by column (see _insert_columnar)
+        if len(data_list) >= self.COLUMNAR_INSERT_MIN_ROWS:
+            try:
+                return self._insert_columnar(
+                    table_name, columns, data_list, pk_columns if use_replace else []
+                )
+            except Exception as e:
+                logger.debug(f"Columnar insert unavailable, using executemany: {e}")
+
         values_list = [tuple(d.get(col) for col in columns) for d in data_list]
 
         try:
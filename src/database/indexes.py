@@ -11,7 +11,9 @@ Index Design Principles:
 5. Covering indexes for frequently queried columns
 """
 
-from typing import Dict, List
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
 
 from src.database.base import BaseDatabase
 from src.utils.logger import get_logger
@@ -300,6 +302,58 @@ INDEXES = {
 }
 
 
+# Connections used to build PostgreSQL indexes in parallel
+PARALLEL_INDEX_WORKERS = 4
+
+
+def _concurrently(statement: str) -> str:
+    """Rewrite ``CREATE INDEX`` as ``CREATE INDEX CONCURRENTLY``.
+
+    Concurrent builds do not block writes to the table (PostgreSQL only).
+
+    Args:
+        statement: CREATE INDEX statement
+
+    Returns:
+        Equivalent CREATE INDEX CONCURRENTLY statement
+    """
+    return statement.replace("CREATE INDEX ", "CREATE INDEX CONCURRENTLY ", 1)
+
+
+def _index_name(statement: str) -> str:
+    """Get the index name from a CREATE INDEX statement.
+
+    Args:
+        statement: CREATE INDEX statement
+
+    Returns:
+        Index name (the word before ``ON``)
+    """
+    return statement.split(" ON ", 1)[0].split()[-1]
+
+
+def _create_index_concurrently(database: BaseDatabase, statement: str) -> None:
+    """Build one index with CREATE INDEX CONCURRENTLY on a worker connection.
+
+    A failed concurrent build leaves an INVALID index behind, which
+    ``IF NOT EXISTS`` would skip on later runs. It is dropped before the
+    error is re-raised, so the next run builds it again.
+
+    Args:
+        database: PostgreSQL handler with its own connection
+        statement: CREATE INDEX statement
+    """
+    try:
+        database.execute_autocommit(_concurrently(statement))
+    except Exception:
+        index_name = _index_name(statement)
+        try:
+            database.execute_autocommit(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+        except Exception as e:
+            logger.warning(f"Failed to drop invalid index {index_name}: {e}")
+        raise
+
+
 class IndexManager:
     """Index management for database tables.
 
@@ -350,43 +404,117 @@ class IndexManager:
             logger.error(f"Failed to create indexes for {table_name}: {e}")
             return False
 
-    def create_all_indexes(self) -> Dict[str, int]:
+    def create_all_indexes(self, max_workers: int = PARALLEL_INDEX_WORKERS) -> Dict[str, int]:
         """Create all indexes for all tables.
 
+        On PostgreSQL the indexes are built with ``CREATE INDEX CONCURRENTLY``
+        by up to ``max_workers`` threads, each on its own connection, so index
+        builds on different tables overlap. SQLite and DuckDB allow a single
+        writer and are processed serially.
+
+        Args:
+            max_workers: Number of parallel connections used on PostgreSQL
+
         Returns:
             Dictionary mapping table names to number of indexes created
         """
-        results = {}
+        if self.database.get_db_type() == "postgresql" and max_workers > 1:
+            results = self._create_all_indexes_parallel(max_workers)
+        else:
+            results = {}
+            for table_name in INDEXES.keys():
+                results[table_name] = self._create_table_indexes(
+                    table_name, self.database.execute
+                )
+
+        total_indexes = sum(results.values())
+        logger.info(f"Created {total_indexes} total indexes across {len(results)} tables")
+
+        return results
 
-        for table_name in INDEXES.keys():
+    def _create_all_indexes_parallel(self, max_workers: int) -> Dict[str, int]:
+        """Create all indexes on PostgreSQL using several connections.
+
+        Workers pull tables from a shared queue. Tables left over because a
+        worker could not connect are indexed on the main connection.
+
+        Args:
+            max_workers: Number of worker connections
+
+        Returns:
+            Dictionary mapping table names to number of indexes created
+        """
+        results = {table_name: 0 for table_name in INDEXES.keys()}
+        pending: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+        for table_name in results:
+            pending.put(table_name)
+
+        def worker() -> Dict[str, int]:
+            counts = {}
             try:
-                index_statements = INDEXES[table_name]
-                success_count = 0
+                worker_db = type(self.database)(self.database.config)
+                worker_db.connect()
+            except Exception as e:
+                logger.warning(f"Index worker could not connect: {e}")
+                return counts
 
-                for statement in index_statements:
+            try:
+                while True:
                     try:
-                        self.database.execute(statement)
-                        success_count += 1
-                    except Exception as e:
-                        logger.error(f"Failed to create index: {e}")
+                        table_name = pending.get_nowait()
+                    except queue.Empty:
+                        break
+                    counts[table_name] = self._create_table_indexes(
+                        table_name,
+                        lambda sql: _create_index_concurrently(worker_db, sql),
+                    )
+            finally:
+                worker_db.disconnect()
+            return counts
 
-                results[table_name] = success_count
+        workers = min(max_workers, len(results))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jltsql-index") as executor:
+            futures = [executor.submit(worker) for _ in range(workers)]
+            for future in futures:
+                results.update(future.result())
 
-                if success_count == len(index_statements):
-                    logger.info(f"Created {success_count} indexes for {table_name}")
-                else:
-                    logger.warning(
-                        f"Created {success_count}/{len(index_statements)} indexes for {table_name}"
-                    )
+        while True:
+            try:
+                table_name = pending.get_nowait()
+            except queue.Empty:
+                break
+            results[table_name] = self._create_table_indexes(table_name, self.database.execute)
 
+        return results
+
+    def _create_table_indexes(self, table_name: str, execute: Callable[[str], object]) -> int:
+        """Run every index statement for a table, continuing past failures.
+
+        Args:
+            table_name: Name of the table
+            execute: Callable that executes one SQL statement
+
+        Returns:
+            Number of indexes created successfully
+        """
+        index_statements = INDEXES[table_name]
+        success_count = 0
+
+        for statement in index_statements:
+            try:
+                execute(statement)
+                success_count += 1
             except Exception as e:
-                logger.error(f"Failed to create indexes for {table_name}: {e}")
-                results[table_name] = 0
+                logger.error(f"Failed to create index: {e}")
 
-        total_indexes = sum(results.values())
-        logger.info(f"Created {total_indexes} total indexes across {len(results)} tables")
+        if success_count == len(index_statements):
+            logger.info(f"Created {success_count} indexes for {table_name}")
+        else:
+            logger.warning(
+                f"Created {success_count}/{len(index_statements)} indexes for {table_name}"
+            )
 
-        return results
+        return success_count
 
     def drop_indexes(self, table_name: str) -> bool:
         """Drop all indexes for a specific table.
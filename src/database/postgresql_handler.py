@@ -3,6 +3,7 @@
 This module provides PostgreSQL database operations for JLTSQL.
 """
 
+import io
 from typing import Any, Dict, List, Optional
 
 try:
@@ -53,6 +54,9 @@ class PostgreSQLDatabase(BaseDatabase):
         ...     db.create_table("test", "CREATE TABLE test (id SERIAL PRIMARY KEY)")
     """
 
+    # Batches of at least this many rows are loaded with COPY
+    COPY_MIN_ROWS = 50
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize PostgreSQL database handler.
 
@@ -255,6 +259,22 @@ class PostgreSQLDatabase(BaseDatabase):
                 self.rollback()
             raise DatabaseError(f"SQL execution failed: {e}")
 
+    def execute_script(self, statements: List[str]) -> None:
+        """Execute several parameterless statements in one round-trip.
+
+        Both drivers send parameterless SQL via the simple query protocol,
+        which accepts multiple statements and runs them as one transaction.
+
+        Args:
+            statements: SQL statements without parameters
+
+        Raises:
+            DatabaseError: If any statement fails
+        """
+        if not statements:
+            return
+        self.execute(self._join_statements(statements))
+
     def executemany(self, sql: str, parameters_list: List[tuple]) -> int:
         """Execute SQL statement with multiple parameter sets.
 
@@ -428,6 +448,15 @@ class PostgreSQLDatabase(BaseDatabase):
         except DatabaseError:
             return False
 
+    def list_tables(self) -> List[str]:
+        """Get the names of all tables in one query.
+
+        Returns:
+            List of (lowercase) table names
+        """
+        rows = self.fetch_all("SELECT tablename FROM pg_tables")
+        return [row["tablename"] for row in rows]
+
     def get_table_columns(self, table_name: str) -> List[Dict[str, Any]]:
         """Get table column information.
 
@@ -507,6 +536,32 @@ class PostgreSQLDatabase(BaseDatabase):
         except DatabaseError:
             raise
 
+    def execute_autocommit(self, sql: str) -> None:
+        """Execute a statement that cannot run inside a transaction block.
+
+        Used for statements such as ``CREATE INDEX CONCURRENTLY``.
+
+        Args:
+            sql: SQL statement without parameters
+
+        Raises:
+            DatabaseError: If execution fails
+        """
+        if DRIVER == "pg8000":
+            # pg8000.native is always in autocommit mode
+            self.execute(sql)
+            return
+
+        if not self._connection:
+            raise DatabaseError("Database not connected")
+
+        old_autocommit = self._connection.autocommit
+        self._connection.autocommit = True
+        try:
+            self.execute(sql)
+        finally:
+            self._connection.autocommit = old_autocommit
+
     def commit(self) -> None:
         """Commit current transaction.
 
@@ -651,9 +706,112 @@ class PostgreSQLDatabase(BaseDatabase):
         else:
             sql = f"INSERT INTO {table_name} ({', '.join(quoted_columns)}) VALUES ({placeholders})"
 
+        # Large batches: COPY into a staging table, then one INSERT ... SELECT
+        if len(data_list) >= self.COPY_MIN_ROWS:
+            try:
+                return self._insert_via_copy(
+                    table_name,
+                    columns,
+                    data_list,
+                    pk_columns if use_replace else None,
+                    conflict_clause=sql[sql.index(" ON CONFLICT"):] if " ON CONFLICT" in sql else "",
+                )
+            except Exception as e:
+                logger.warning(
+                    "COPY insert failed, falling back to executemany",
+                    table=table_name,
+                    error=str(e),
+                )
+
         # Extract values in correct order for each row
         parameters_list = [
             tuple(row.get(col) for col in columns) for row in data_list
         ]
 
         return self.executemany(sql, parameters_list)
+
+    @staticmethod
+    def _copy_text_value(value: Any) -> str:
+        """Encode a value for COPY ... FROM STDIN text format."""
+        if value is None:
+            return "\\N"
+        return (
+            str(value)
+            .replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+
+    def _insert_via_copy(
+        self,
+        table_name: str,
+        columns: List[str],
+        data_list: List[Dict[str, Any]],
+        pk_columns: Optional[List[str]],
+        conflict_clause: str,
+    ) -> int:
+        """Insert rows with COPY into a temporary staging table.
+
+        The batch is streamed with COPY FROM STDIN into a session-local
+        temporary table shaped like the target, then moved with a single
+        INSERT ... SELECT carrying the same ON CONFLICT clause as the
+        row-by-row path. Rows with duplicate primary keys are reduced to
+        the last one first, as repeated UPSERTs would leave it.
+
+        Args:
+            table_name: Target table name
+            columns: Column names (taken from the first row)
+            data_list: Rows to insert
+            pk_columns: Lowercase primary key columns for de-duplication
+            conflict_clause: " ON CONFLICT ..." suffix, or "" for plain INSERT
+
+        Returns:
+            Number of rows in the batch
+
+        Raises:
+            Exception: If any step fails (the caller falls back)
+        """
+        rows = [tuple(row.get(col) for col in columns) for row in data_list]
+
+        if pk_columns:
+            positions = {col.lower(): i for i, col in enumerate(columns)}
+            if all(pk in positions for pk in pk_columns):
+                key_positions = [positions[pk] for pk in pk_columns]
+                latest = {}
+                for row in rows:
+                    latest[tuple(row[i] for i in key_positions)] = row
+                rows = list(latest.values())
+
+        column_list = ", ".join(self._quote_identifier(col) for col in columns)
+        stage = f"_jltsql_stage_{table_name.lower()}"
+        statements = [
+            f"CREATE TEMP TABLE IF NOT EXISTS {stage} (LIKE {table_name} INCLUDING DEFAULTS)",
+            f"TRUNCATE {stage}",
+        ]
+        copy_sql = f"COPY {stage} ({column_list}) FROM STDIN"
+        move_sql = (
+            f"INSERT INTO {table_name} ({column_list}) "
+            f"SELECT {column_list} FROM {stage}{conflict_clause}"
+        )
+
+        if DRIVER == "pg8000":
+            # pg8000.native is autocommit; the INSERT ... SELECT is atomic
+            for statement in statements:
+                self._connection.run(statement)
+            text = "".join(
+                "\t".join(self._copy_text_value(v) for v in row) + "\n" for row in rows
+            )
+            self._connection.run(copy_sql, stream=io.StringIO(text))
+            self._connection.run(move_sql)
+        else:  # psycopg
+            # Savepoint, so a failure does not abort the caller's transaction
+            with self._connection.transaction():
+                for statement in statements:
+                    self._cursor.execute(statement)
+                with self._cursor.copy(copy_sql) as copy:
+                    for row in rows:
+                        copy.write_row(row)
+                self._cursor.execute(move_sql)
+
+        return len(data_list)
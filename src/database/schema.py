@@ -90,13 +90,18 @@ Benefits with PRIMARY KEY constraints:
 - Optimized query performance on primary key columns
 """
 
-from typing import Dict, List
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 from src.database.base import BaseDatabase
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Database file -> (file signature, missing table names)
+_missing_tables_cache: Dict[tuple, Tuple[tuple, Tuple[str, ...]]] = {}
+
 
 SCHEMAS = {
     "NL_BN": """
@@ -2243,6 +2248,12 @@ SCHEMAS = {
     """
 }
 
+# Table names by prefix, computed once at import
+NL_TABLE_NAMES: Tuple[str, ...] = tuple(name for name in SCHEMAS if name.startswith("NL_"))
+RT_TABLE_NAMES: Tuple[str, ...] = tuple(name for name in SCHEMAS if name.startswith("RT_"))
+NL_TABLE_SET = frozenset(NL_TABLE_NAMES)
+RT_TABLE_SET = frozenset(RT_TABLE_NAMES)
+
 
 class SchemaManager:
     """Schema management for JLTSQL database.
@@ -2257,6 +2268,9 @@ class SchemaManager:
             db: Database instance
         """
         self.db = db
+        # Table name -> error message for tables that failed in the last
+        # create_table/create_tables call
+        self.errors: Dict[str, str] = {}
 
     def get_table_names(self) -> List[str]:
         """Get list of all table names in schema.
@@ -2269,6 +2283,8 @@ class SchemaManager:
     def create_table(self, table_name: str) -> bool:
         """Create single table.
 
+        On failure the error message is stored in ``self.errors``.
+
         Args:
             table_name: Name of table to create
 
@@ -2277,8 +2293,10 @@ class SchemaManager:
         """
         if table_name not in SCHEMAS:
             logger.error(f"Unknown table: {table_name}")
+            self.errors[table_name] = "unknown table"
             return False
 
+        _missing_tables_cache.clear()
         try:
             schema_sql = SCHEMAS[table_name]
             self.db.execute(schema_sql)
@@ -2286,30 +2304,54 @@ class SchemaManager:
             return True
         except Exception as e:
             logger.error(f"Failed to create table {table_name}: {e}")
+            self.errors[table_name] = str(e)
             return False
 
-    def create_all_tables(self) -> Dict[str, bool]:
-        """Create all tables defined in SCHEMAS.
+    def create_tables(self, table_names: List[str]) -> Dict[str, bool]:
+        """Create several tables in one batch.
+
+        All CREATE TABLE statements are sent together in one transaction
+        (see BaseDatabase.execute_script). If the batch fails, tables are
+        created one by one so that a single bad table does not block the rest.
+
+        Error messages for failed tables are left in ``self.errors``.
+
+        Args:
+            table_names: Names of tables to create
 
         Returns:
             Dictionary mapping table names to success status
         """
-        logger.info("Creating all tables...")
-        results = {}
-
-        for table_name, schema_sql in SCHEMAS.items():
-            try:
-                self.db.execute(schema_sql)
-                logger.debug(f"Created table: {table_name}")
-                results[table_name] = True
-            except Exception as e:
-                logger.error(f"Failed to create table {table_name}: {e}")
-                results[table_name] = False
+        self.errors = {}
+        unknown = [name for name in table_names if name not in SCHEMAS]
+        for name in unknown:
+            logger.error(f"Unknown table: {name}")
+            self.errors[name] = "unknown table"
+        names = [name for name in table_names if name in SCHEMAS]
+
+        results = {name: False for name in unknown}
+        _missing_tables_cache.clear()
+        try:
+            self.db.execute_script([SCHEMAS[name] for name in names])
+            results.update((name, True) for name in names)
+        except Exception as e:
+            logger.warning(f"Batch table creation failed, retrying one by one: {e}")
+            for name in names:
+                results[name] = self.create_table(name)
 
         success_count = sum(1 for v in results.values() if v)
-        logger.info(f"Successfully created {success_count}/{len(SCHEMAS)} tables")
+        logger.info(f"Successfully created {success_count}/{len(table_names)} tables")
         return results
 
+    def create_all_tables(self) -> Dict[str, bool]:
+        """Create all tables defined in SCHEMAS.
+
+        Returns:
+            Dictionary mapping table names to success status
+        """
+        logger.info("Creating all tables...")
+        return self.create_tables(list(SCHEMAS.keys()))
+
     def table_exists(self, table_name: str) -> bool:
         """Check if table exists in database.
 
@@ -2327,24 +2369,62 @@ class SchemaManager:
         Returns:
             List of table names that exist in database
         """
-        existing = []
-        for table_name in SCHEMAS.keys():
-            if self.db.table_exists(table_name):
-                existing.append(table_name)
-        return existing
+        missing = set(self._find_missing_tables())
+        return [name for name in SCHEMAS if name not in missing]
 
     def get_missing_tables(self) -> List[str]:
         """Get list of missing tables.
 
+        For SQLite/DuckDB the result is cached until the database (or its
+        WAL) file changes. PostgreSQL has no file to check, so it is asked
+        every time (one catalog query). Creating tables through this manager
+        invalidates the cache.
+
         Returns:
             List of table names that don't exist in database
         """
-        missing = []
-        for table_name in SCHEMAS.keys():
-            if not self.db.table_exists(table_name):
-                missing.append(table_name)
+        identity, signature = self._cache_key()
+        if identity is not None:
+            cached = _missing_tables_cache.get(identity)
+            if cached is not None and cached[0] == signature:
+                return list(cached[1])
+
+        missing = self._find_missing_tables()
+
+        if identity is not None:
+            _missing_tables_cache[identity] = (signature, tuple(missing))
         return missing
 
+    def _find_missing_tables(self) -> List[str]:
+        """Query the database for tables in SCHEMAS that do not exist."""
+        # One query for all tables instead of one per table
+        existing = {name.lower() for name in self.db.list_tables()}
+        return [name for name in SCHEMAS if name.lower() not in existing]
+
+    def _cache_key(self) -> Tuple[Optional[tuple], Optional[tuple]]:
+        """Get (identity, file signature) for the missing-table cache.
+
+        Returns (None, None) when the database cannot be cached
+        (server and in-memory databases).
+        """
+        db_type = self.db.get_db_type()
+
+        if db_type in ("sqlite", "duckdb"):
+            db_path = getattr(self.db, "db_path", None)
+            if db_path is None or str(db_path) == ":memory:":
+                return None, None
+            signature = []
+            # Include the WAL file: schema changes land there before a checkpoint
+            for path in (str(db_path), f"{db_path}-wal", f"{db_path}.wal"):
+                try:
+                    st = os.stat(path)
+                    signature.append((st.st_mtime_ns, st.st_size))
+                except OSError:
+                    signature.append(None)
+            return (db_type, str(Path(db_path).resolve())), tuple(signature)
+
+        return None, None
+
     def apply_metadata_to_table(self, table_name: str) -> bool:
         """Apply metadata to a specific table.
 
@@ -2491,11 +2571,17 @@ def create_all_tables(db: BaseDatabase) -> None:
         db: Database instance
     """
     logger.info("Creating tables...")
-    for table_name, schema_sql in SCHEMAS.items():
-        try:
-            db.execute(schema_sql)
-            logger.debug(f"Created table: {table_name}")
-        except Exception as e:
-            logger.error(f"Failed to create table {table_name}: {e}")
-            raise
+    _missing_tables_cache.clear()
+    try:
+        # One batch/transaction instead of one round-trip per table
+        db.execute_script(list(SCHEMAS.values()))
+    except Exception:
+        # Re-run one by one to report which table failed
+        for table_name, schema_sql in SCHEMAS.items():
+            try:
+                db.execute(schema_sql)
+                logger.debug(f"Created table: {table_name}")
+            except Exception as e:
+                logger.error(f"Failed to create table {table_name}: {e}")
+                raise
     logger.info(f"Successfully created {len(SCHEMAS)} tables")
\ No newline at end of file
@@ -125,6 +125,31 @@ class SQLiteDatabase(BaseDatabase):
                 self._connection.rollback()
             raise DatabaseError(f"SQL execution failed: {e}")
 
+    def execute_script(self, statements: List[str]) -> None:
+        """Execute several parameterless statements in one transaction.
+
+        Python's sqlite3 runs DDL in autocommit mode, so each CREATE TABLE
+        would otherwise be committed (and synced) separately.
+
+        Args:
+            statements: SQL statements without parameters
+
+        Raises:
+            DatabaseError: If any statement fails
+        """
+        if not self._cursor:
+            raise DatabaseError("Database not connected")
+
+        own_transaction = not self._connection.in_transaction
+        if own_transaction:
+            self._cursor.execute("BEGIN")
+
+        for sql in statements:
+            self.execute(sql)  # rolls back on failure
+
+        if own_transaction:
+            self._connection.commit()
+
     def executemany(self, sql: str, parameters_list: List[tuple]) -> int:
         """Execute SQL statement with multiple parameter sets.
 
@@ -249,6 +274,15 @@ class SQLiteDatabase(BaseDatabase):
         except DatabaseError:
             return False
 
+    def list_tables(self) -> List[str]:
+        """Get the names of all tables in one query.
+
+        Returns:
+            List of table names
+        """
+        rows = self.fetch_all("SELECT name FROM sqlite_master WHERE type='table'")
+        return [row["name"] for row in rows]
+
     def get_table_info(self, table_name: str) -> List[Dict[str, Any]]:
         """Get table schema information.
 
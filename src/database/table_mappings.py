@@ -7,13 +7,17 @@ Mappings:
 - JRAVAN_TO_JLTSQL: JRA-VAN standard names -> jrvltsql table names
 - RECORD_TYPE_TO_TABLE: Two-character record type codes -> table names
 - JLTSQL_TO_JRAVAN: Reverse mapping (jrvltsql -> JRA-VAN standard)
+
+JRAVAN_TO_JLTSQL and JLTSQL_TO_JRAVAN are read-only views; use the
+*_GET bound methods for lookups on hot paths.
 """
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping
 
 
 # JRA-VAN標準名 → jrvltsqlテーブル名
-JRAVAN_TO_JLTSQL: Dict[str, str] = {
+JRAVAN_TO_JLTSQL: Mapping[str, str] = MappingProxyType({
     # マスタデータ (Master Data)
     "UMA": "NL_UM",           # 競走馬マスタ (Horse Master)
     "KISYU": "NL_KS",         # 騎手マスタ (Jockey Master)
@@ -63,7 +67,8 @@ JRAVAN_TO_JLTSQL: Dict[str, str] = {
     "MEANING": "NL_HY",       # 馬名の意味由来 (Horse Name Meaning)
     "WEIGHT_CHANGE": "NL_JG", # 重量変更 (Weight Change)
     "WOOD": "NL_WC",          # ウッドチップ調教 (Woodchip Training)
-}
+})
+JRAVAN_TO_JLTSQL_GET = JRAVAN_TO_JLTSQL.get
 
 # レコード種別コード → テーブル名 (Record Type Code -> Table Name)
 # All 38 supported record types from JV-Data specification
@@ -109,9 +114,15 @@ RECORD_TYPE_TO_TABLE: Dict[str, str] = {
 }
 
 # 逆マッピング: jrvltsqlテーブル名 → JRA-VAN標準名
-JLTSQL_TO_JRAVAN: Dict[str, str] = {
-    v: k for k, v in JRAVAN_TO_JLTSQL.items()
-}
+# 同じテーブルに複数の標準名がある場合は先に定義された名前を正とする
+_jltsql_to_jravan: Dict[str, str] = {}
+for _jravan_name, _jltsql_name in JRAVAN_TO_JLTSQL.items():
+    _jltsql_to_jravan.setdefault(_jltsql_name, _jravan_name)
+
+JLTSQL_TO_JRAVAN: Mapping[str, str] = MappingProxyType(_jltsql_to_jravan)
+JLTSQL_TO_JRAVAN_GET = JLTSQL_TO_JRAVAN.get
+
+del _jravan_name, _jltsql_name
 
 # テーブル名 → レコード種別コード逆マッピング
 TABLE_TO_RECORD_TYPE: Dict[str, str] = {
@@ -3,6 +3,7 @@
 This module provides the base class for fetching JV-Data from JV-Link.
 """
 
+import logging
 import time
 from abc import ABC, abstractmethod
 from typing import Iterator, Optional
@@ -10,7 +11,7 @@ from typing import Iterator, Optional
 from src.jvlink.constants import JV_READ_NO_MORE_DATA, JV_READ_SUCCESS
 from src.jvlink.wrapper import JVLinkWrapper
 from src.parser.factory import ParserFactory
-from src.utils.logger import get_logger
+from src.utils.logger import get_logger, is_enabled_for
 from src.utils.progress import JVLinkProgressDisplay
 
 logger = get_logger(__name__)
@@ -96,11 +97,15 @@ class BaseFetcher(ABC):
         self._start_time = time.time()
         last_update_time = self._start_time
         update_interval = 2.0  # 更新間隔を増やして高速化  # Update progress every 0.5 seconds (reduced to prevent flickering)
+        # Bind hot-loop callables once instead of resolving attributes per record
+        jv_read = self.jvlink.jv_read
+        parse = self.parser_factory.parse
+        debug_enabled = is_enabled_for(__name__, logging.DEBUG)
 
         while True:
             try:
                 # Read next record
-                ret_code, buff, filename = self.jvlink.jv_read()
+                ret_code, buff, filename = jv_read()
 
                 # Return code meanings:
                 # > 0: Success with data (value is data length)
@@ -147,16 +152,17 @@ class BaseFetcher(ABC):
 
                     # Parse record
                     try:
-                        data = self.parser_factory.parse(buff)
+                        data = parse(buff)
                         if data:
                             # Filter by to_date if specified
                             if to_date and not self._is_within_date_range(data, to_date):
                                 # Skip records after to_date
-                                logger.debug(
-                                    "Skipping record outside date range",
-                                    record_num=self._records_fetched,
-                                    to_date=to_date,
-                                )
+                                if debug_enabled:
+                                    logger.debug(
+                                        "Skipping record outside date range",
+                                        record_num=self._records_fetched,
+                                        to_date=to_date,
+                                    )
                                 continue
 
                             self._records_parsed += 1
@@ -3,12 +3,13 @@
 This module fetches historical JV-Data from JV-Link.
 """
 
+import logging
 import time
 from datetime import datetime
 from typing import Iterator, Optional
 
 from src.fetcher.base import BaseFetcher, FetcherError
-from src.utils.logger import get_logger
+from src.utils.logger import get_logger, is_enabled_for
 from src.utils.progress import JVLinkProgressDisplay
 
 logger = get_logger(__name__)
@@ -83,6 +84,8 @@ class HistoricalFetcher(BaseFetcher):
 
         download_task_id = None
         fetch_task_id = None
+        # Checked once; fetch() may run in a tight monitor loop
+        info_enabled = is_enabled_for(__name__, logging.INFO)
 
         try:
             # Info for setup mode (option 3 or 4) - ログのみ、画面表示はしない
@@ -109,19 +112,20 @@ class HistoricalFetcher(BaseFetcher):
             fromtime = f"{from_date}000000"
 
             # Open data stream
-            logger.info(
-                "Opening data stream",
-                data_spec=data_spec,
-                from_date=from_date,
-                to_date=to_date,
-                fromtime=fromtime,
-                option=option,
-                note=(
-                    "option=1: 通常データ（差分）; "
-                    "option=2: 今週データ; "
-                    "option=3/4: セットアップ（全データ）"
-                ),
-            )
+            if info_enabled:
+                logger.info(
+                    "Opening data stream",
+                    data_spec=data_spec,
+                    from_date=from_date,
+                    to_date=to_date,
+                    fromtime=fromtime,
+                    option=option,
+                    note=(
+                        "option=1: 通常データ（差分）; "
+                        "option=2: 今週データ; "
+                        "option=3/4: セットアップ（全データ）"
+                    ),
+                )
 
             result, read_count, download_count, last_file_timestamp = self.jvlink.jv_open(
                 data_spec,
@@ -129,13 +133,14 @@ class HistoricalFetcher(BaseFetcher):
                 option,
             )
 
-            logger.info(
-                "Data stream opened",
-                result_code=result,
-                read_count=read_count,
-                download_count=download_count,
-                last_file_timestamp=last_file_timestamp,
-            )
+            if info_enabled:
+                logger.info(
+                    "Data stream opened",
+                    result_code=result,
+                    read_count=read_count,
+                    download_count=download_count,
+                    last_file_timestamp=last_file_timestamp,
+                )
 
             # Check if data is empty (result=-1 or read_count=0)
             if result == -1 or read_count == 0:
@@ -181,10 +186,11 @@ class HistoricalFetcher(BaseFetcher):
 
             # Log summary
             stats = self.get_statistics()
-            logger.info(
-                "Fetch completed",
-                **stats,
-            )
+            if info_enabled:
+                logger.info(
+                    "Fetch completed",
+                    **stats,
+                )
 
             if self.progress_display:
                 self.progress_display.print_success(
@@ -22,6 +22,11 @@ class BatchProcessor:
     Fetches data from JV-Link starting from the specified date and filters
     records client-side based on the end date.
 
+    JV-Link is read on the calling thread (its COM object belongs to the
+    thread that created it). For DuckDB and PostgreSQL, full batches are
+    queued to a background writer so reading continues while they are
+    inserted.
+
     Note:
         Service key must be configured in JRA-VAN DataLab application
         before using this class.
@@ -39,6 +44,9 @@ class BatchProcessor:
         ...     )
     """
 
+    # Database types whose imports run on a background writer thread
+    BACKGROUND_WRITE_DB_TYPES = frozenset({"duckdb", "postgresql"})
+
     def __init__(
         self,
         database: BaseDatabase,
@@ -46,6 +54,7 @@ class BatchProcessor:
         sid: str = "UNKNOWN",
         service_key: Optional[str] = None,
         show_progress: bool = True,
+        write_queue_size: int = DataImporter.MAX_PENDING_BATCHES,
     ):
         """Initialize batch processor.
 
@@ -56,9 +65,18 @@ class BatchProcessor:
             service_key: Optional JV-Link service key. If provided, it will be set
                         programmatically without requiring registry configuration.
             show_progress: Show stylish progress display (default: True)
+            write_queue_size: Batches that may wait for the background writer
+                        before JV-Link reading pauses (DuckDB/PostgreSQL only)
         """
         self.fetcher = HistoricalFetcher(sid, service_key=service_key, show_progress=show_progress)
-        self.importer = DataImporter(database, batch_size)
+        # Overlap inserts with JV-Link reads where the backend benefits from it
+        # (SQLite writes are serial and gain nothing from a writer thread)
+        self.importer = DataImporter(
+            database,
+            batch_size,
+            background_writes=database.get_db_type() in self.BACKGROUND_WRITE_DB_TYPES,
+            max_pending_batches=write_queue_size,
+        )
         self.database = database
 
         logger.info("BatchProcessor initialized", sid=sid,
@@ -117,6 +135,8 @@ class BatchProcessor:
 
         # Fetch and import records
         try:
+            # Statistics must not carry over when the processor is reused
+            self.fetcher.reset_statistics()
             records = self.fetcher.fetch(data_spec, from_date, to_date, option)
             import_stats = self.importer.import_records(records, auto_commit)
 
@@ -206,14 +226,19 @@ class BatchProcessor:
         from_date: str,
         to_date: str,
         auto_commit: bool = True,
+        option: int = 1,
     ) -> dict:
         """Process multiple data specifications.
 
+        All specs share this processor's database connection and JV-Link
+        session.
+
         Args:
             data_specs: List of data specification codes
             from_date: Start date (YYYYMMDD)
             to_date: End date (YYYYMMDD)
             auto_commit: Whether to auto-commit
+            option: JVOpen option applied to every spec (default: 1)
 
         Returns:
             Dictionary mapping data_spec to statistics
@@ -235,7 +260,8 @@ class BatchProcessor:
                     data_spec,
                     from_date,
                     to_date,
-                    auto_commit,
+                    option=option,
+                    auto_commit=auto_commit,
                     ensure_tables=False,  # Only check once
                 )
                 results[data_spec] = stats
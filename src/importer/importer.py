@@ -3,10 +3,14 @@
 This module imports parsed JV-Data records into database.
 """
 
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Iterator, List, Optional
 
 from src.database.base import BaseDatabase, DatabaseError
 from src.database.schema_types import get_table_column_types
+from src.database.table_mappings import JLTSQL_TO_JRAVAN_GET
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -83,17 +87,30 @@ class DataImporter:
         Without PRIMARY KEY constraints, all records are inserted which may
         result in duplicate data. See schema.py for table definitions.
 
+    Background Writes:
+        With background_writes=True, full batches are handed to a single
+        writer thread so database inserts overlap with fetching and parsing
+        of the next records. Only one thread touches the connection at a
+        time, and at most max_pending_batches batches are held in memory.
+
     Attributes:
         database: Database handler instance
         batch_size: Number of records to insert per batch
         use_jravan_schema: Whether to use JRA-VAN standard table names
+        background_writes: Whether batches are written on a writer thread
+        max_pending_batches: Batches queued for the writer before fetching blocks
     """
 
+    # Default number of batches queued for the background writer
+    MAX_PENDING_BATCHES = 4
+
     def __init__(
         self,
         database: BaseDatabase,
         batch_size: int = 1000,
         use_jravan_schema: bool = False,
+        background_writes: bool = False,
+        max_pending_batches: int = MAX_PENDING_BATCHES,
     ):
         """Initialize data importer.
 
@@ -102,14 +119,21 @@ class DataImporter:
             batch_size: Records per batch (default: 1000)
             use_jravan_schema: Use JRA-VAN standard table names (RACE, UMA_RACE, etc.)
                                instead of jltsql names (NL_RA, NL_SE, etc.)
+            background_writes: Write batches on a background thread so inserts
+                               overlap with record fetching (default: False)
+            max_pending_batches: Batches the background writer may have queued
+                                 before fetching waits for it (default: 4)
         """
         self.database = database
         self.batch_size = batch_size
         self.use_jravan_schema = use_jravan_schema
+        self.background_writes = background_writes
+        self.max_pending_batches = max(1, max_pending_batches)
 
         self._records_imported = 0
         self._records_failed = 0
         self._batches_processed = 0
+        self._stats_lock = threading.Lock()
 
         # Map record types to table names
         # Note: Table names match schema.py table definitions (e.g. NL_RA, not NL_RA_RACE)
@@ -180,6 +204,7 @@ class DataImporter:
             "DataImporter initialized",
             batch_size=batch_size,
             use_jravan_schema=use_jravan_schema,
+            background_writes=background_writes,
         )
 
     def _get_table_name(self, record_type: str) -> Optional[str]:
@@ -198,8 +223,7 @@ class DataImporter:
 
         # Convert to JRA-VAN standard name if requested
         if self.use_jravan_schema:
-            from src.database.table_mappings import JLTSQL_TO_JRAVAN
-            return JLTSQL_TO_JRAVAN.get(table_name, table_name)
+            return JLTSQL_TO_JRAVAN_GET(table_name, table_name)
 
         return table_name
 
@@ -355,6 +379,19 @@ class DataImporter:
         # Group records by type for batch insertion
         batch_buffers: Dict[str, List[dict]] = {}
 
+        # Background writer (single thread keeps the connection single-user)
+        writer = ThreadPoolExecutor(max_workers=1) if self.background_writes else None
+        pending = deque()
+
+        def flush(table_name: str, batch: List[dict]):
+            if writer is None:
+                self._flush_batch(table_name, batch, auto_commit)
+                return
+            # Bound memory: wait for the oldest batch before queueing more
+            while len(pending) >= self.max_pending_batches:
+                pending.popleft().result()
+            pending.append(writer.submit(self._flush_batch, table_name, batch, auto_commit))
+
         try:
             for record in records:
                 # Get record type and table name
@@ -369,7 +406,8 @@ class DataImporter:
                         "Record missing record type field",
                         record_keys=list(record.keys())[:5] if record else None
                     )
-                    self._records_failed += 1
+                    with self._stats_lock:
+                        self._records_failed += 1
                     continue
 
                 table_name = self._get_table_name(record_type)
@@ -378,7 +416,8 @@ class DataImporter:
                         f"Unknown record type: {record_type}",
                         record_type=record_type,
                     )
-                    self._records_failed += 1
+                    with self._stats_lock:
+                        self._records_failed += 1
                     continue
 
                 # Add to batch buffer
@@ -389,17 +428,17 @@ class DataImporter:
 
                 # Check if any batch is full
                 if len(batch_buffers[table_name]) >= self.batch_size:
-                    self._flush_batch(
-                        table_name,
-                        batch_buffers[table_name],
-                        auto_commit,
-                    )
+                    flush(table_name, batch_buffers[table_name])
                     batch_buffers[table_name] = []
 
             # Flush remaining batches
             for table_name, batch in batch_buffers.items():
                 if batch:
-                    self._flush_batch(table_name, batch, auto_commit)
+                    flush(table_name, batch)
+
+            # Wait for the background writer to finish
+            while pending:
+                pending.popleft().result()
 
             # Log summary
             stats = self.get_statistics()
@@ -411,6 +450,11 @@ class DataImporter:
             logger.error("Import failed", error=str(e))
             raise ImporterError(f"Failed to import records: {e}")
 
+        finally:
+            if writer is not None:
+                # Never return while the writer may still use the connection
+                writer.shutdown(wait=True)
+
     def _flush_batch(
         self,
         table_name: str,
@@ -435,8 +479,9 @@ class DataImporter:
             # Insert batch using INSERT OR REPLACE
             rows = self.database.insert_many(table_name, converted_batch, use_replace=True)
 
-            self._records_imported += rows
-            self._batches_processed += 1
+            with self._stats_lock:
+                self._records_imported += rows
+                self._batches_processed += 1
 
             if auto_commit:
                 self.database.commit()
@@ -493,8 +538,9 @@ class DataImporter:
                         error=str(record_error),
                     )
 
-            self._records_imported += success_count
-            self._records_failed += fail_count
+            with self._stats_lock:
+                self._records_imported += success_count
+                self._records_failed += fail_count
 
             # Only commit if we had successful individual inserts
             if auto_commit and success_count > 0:
@@ -9,6 +9,7 @@ Key optimizations:
 
 from typing import Dict, Iterator, List, Optional
 from src.database.base import BaseDatabase, DatabaseError
+from src.database.table_mappings import JLTSQL_TO_JRAVAN_GET
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -85,8 +86,7 @@ class OptimizedDataImporter:
             return None
 
         if self.use_jravan_schema:
-            from src.database.table_mappings import JLTSQL_TO_JRAVAN
-            return JLTSQL_TO_JRAVAN.get(table_name, table_name)
+            return JLTSQL_TO_JRAVAN_GET(table_name, table_name)
 
         return table_name
 
@@ -4,6 +4,8 @@ This module provides a Python wrapper for the JV-Link COM API,
 which is used to access JRA-VAN DataLab horse racing data.
 """
 
+import codecs
+import logging
 from typing import Optional, Tuple
 
 from src.jvlink.constants import (
@@ -13,13 +15,119 @@ from src.jvlink.constants import (
     JV_READ_NO_MORE_DATA,
     JV_READ_SUCCESS,
     JV_RT_ERROR,
+    JV_RT_NO_MORE_DATA,
     JV_RT_SUCCESS,
+    JV_RT_UNSUBSCRIBED_DATA_WARNING,
     get_error_message,
 )
-from src.utils.logger import get_logger
+from src.utils.logger import get_logger, is_enabled_for
+
+try:
+    import win32com.client
+except ImportError:  # pywin32 is only available on Windows
+    win32com = None
 
 logger = get_logger(__name__)
 
+# JVOpen results that mean "no data from this timestamp" rather than an error
+_JVOPEN_NO_DATA_CODES = frozenset({JV_RT_ERROR, JV_RT_NO_MORE_DATA})
+
+# CP1252 to byte mapping for the 0x80-0x9F range. pywin32 sometimes turns
+# these raw Shift-JIS bytes into the CP1252 characters below.
+CP1252_TO_BYTE = {
+    0x20AC: 0x80,  # €
+    0x201A: 0x82,  # ‚
+    0x0192: 0x83,  # ƒ
+    0x201E: 0x84,  # „
+    0x2026: 0x85,  # …
+    0x2020: 0x86,  # †
+    0x2021: 0x87,  # ‡
+    0x02C6: 0x88,  # ˆ
+    0x2030: 0x89,  # ‰
+    0x0160: 0x8A,  # Š
+    0x2039: 0x8B,  # ‹
+    0x0152: 0x8C,  # Œ
+    0x017D: 0x8E,  # Ž
+    0x2018: 0x91,  # '
+    0x2019: 0x92,  # '
+    0x201C: 0x93,  # "
+    0x201D: 0x94,  # "
+    0x2022: 0x95,  # •
+    0x2013: 0x96,  # –
+    0x2014: 0x97,  # —
+    0x02DC: 0x98,  # ˜
+    0x2122: 0x99,  # ™
+    0x0161: 0x9A,  # š
+    0x203A: 0x9B,  # ›
+    0x0153: 0x9C,  # œ
+    0x017E: 0x9E,  # ž
+    0x0178: 0x9F,  # Ÿ
+}
+
+# Folds CP1252 characters back into U+0080-U+009F so the latin-1 encoder
+# can emit their original byte. U+FFFD (データ破損) becomes '0' so numeric
+# fields still parse.
+_BSTR_RUN_TRANSLATE = str.maketrans(
+    {cp: chr(byte) for cp, byte in CP1252_TO_BYTE.items()} | {0xFFFD: "0"}
+)
+
+# Error handlers for the built-in latin-1 codec rather than a separate
+# charmap codec: a charmap encoding table gives each byte exactly one code
+# point, but here both U+0093 and U+201C must become 0x93, and the latin-1
+# encoder already runs in C for the raw-byte characters.
+_BSTR_ERRORS = "jltsql-bstr"
+_BSTR_CP932_ERRORS = "jltsql-bstr-cp932"
+
+
+def _encode_bstr_run(exc: UnicodeEncodeError) -> Tuple[bytes, int]:
+    """Encode a run of non-Latin-1 characters found by the latin-1 codec.
+
+    CP1252 characters go back to their original byte, anything else is
+    encoded as cp932 ('?' if impossible).
+    """
+    run = exc.object[exc.start:exc.end].translate(_BSTR_RUN_TRANSLATE)
+    return run.encode("latin-1", errors=_BSTR_CP932_ERRORS), exc.end
+
+
+def _encode_cp932_run(exc: UnicodeEncodeError) -> Tuple[bytes, int]:
+    """Encode characters that remain above U+00FF as cp932."""
+    return exc.object[exc.start:exc.end].encode("cp932", errors="replace"), exc.end
+
+
+codecs.register_error(_BSTR_ERRORS, _encode_bstr_run)
+codecs.register_error(_BSTR_CP932_ERRORS, _encode_cp932_run)
+
+
+def _bstr_to_bytes(buff_str: str) -> bytes:
+    """Recover the raw Shift-JIS bytes of a JVRead/JVGets buffer.
+
+    JV-Link stores Shift-JIS bytes directly in a BSTR, one byte per UTF-16
+    code unit, so pywin32 normally returns a str whose code points are the
+    original bytes (U+0000-U+00FF) and latin-1 recovers them exactly.
+    Depending on the environment pywin32 may instead return bytes 0x80-0x9F
+    as CP1252 characters (e.g. U+201C), or proper Unicode Japanese text.
+
+    Args:
+        buff_str: Buffer string returned by the COM call
+
+    Returns:
+        Shift-JIS encoded record bytes
+    """
+    # 高速変換: 3段階のエンコード戦略
+    # 1. Latin-1（ASCII + 拡張ASCII）- 最速
+    # 2. CP932（日本語）- 高速
+    # 3. Latin-1で一括変換し、範囲外の文字だけエラーハンドラで個別処理 - まれ
+    try:
+        return buff_str.encode("latin-1")
+    except UnicodeEncodeError:
+        pass
+    try:
+        # 日本語を含む場合はcp932で一括変換
+        return buff_str.encode("cp932")
+    except UnicodeEncodeError:
+        pass
+    return buff_str.encode("latin-1", errors=_BSTR_ERRORS)
+
 
 class JVLinkError(Exception):
     """JV-Link related error."""
@@ -76,11 +184,19 @@ class JVLinkWrapper:
         self.sid = sid
         self._jvlink = None
         self._is_open = False
+        # Set once JVRead/JVGets reports completion; further reads return
+        # completion without another COM round trip until the next open
+        self._read_complete = False
 
-        try:
-            import win32com.client
+        if win32com is None:
+            raise JVLinkError("Failed to create JV-Link COM object: pywin32 (win32com) is not installed")
 
+        try:
             self._jvlink = win32com.client.Dispatch("JVDTLab.JVLink")
+            # Per-record methods are resolved once; dynamic dispatch would
+            # otherwise look the name up through __getattr__ on every call
+            self._jv_read = self._jvlink.JVRead
+            self._jv_gets = self._jvlink.JVGets
             logger.info("JV-Link COM object created", sid=sid)
         except Exception as e:
             raise JVLinkError(f"Failed to create JV-Link COM object: {e}")
@@ -233,7 +349,9 @@ class JVLinkWrapper:
                     error_code=result,
                 )
                 raise JVLinkError("JVOpen failed", error_code=result)
-            elif result in (-1, -2):
+
+            info_enabled = is_enabled_for(__name__, logging.INFO)
+            if result in _JVOPEN_NO_DATA_CODES and info_enabled:
                 # -1 and -2 both mean "no data available" - NOT an error
                 logger.info(
                     "JVOpen: No data available",
@@ -243,16 +361,18 @@ class JVLinkWrapper:
                 )
 
             self._is_open = True
+            self._read_complete = False
 
-            logger.info(
-                "JVOpen successful",
-                data_spec=data_spec,
-                fromtime=fromtime,
-                option=option,
-                read_count=read_count,
-                download_count=download_count,
-                last_file_timestamp=last_file_timestamp,
-            )
+            if info_enabled:
+                logger.info(
+                    "JVOpen successful",
+                    data_spec=data_spec,
+                    fromtime=fromtime,
+                    option=option,
+                    read_count=read_count,
+                    download_count=download_count,
+                    last_file_timestamp=last_file_timestamp,
+                )
 
             return result, read_count, download_count, last_file_timestamp
 
@@ -302,7 +422,7 @@ class JVLinkWrapper:
                     # データなしは例外にせず、結果をそのまま返す
                     return result, read_count
                 # -114: 契約外データ種別（警告レベル、ユーザーには問題なし）
-                elif result == -114:
+                elif result == JV_RT_UNSUBSCRIBED_DATA_WARNING:
                     logger.debug("JVRTOpen: data spec not subscribed", data_spec=data_spec, error_code=result)
                     raise JVLinkError("JVRTOpen failed", error_code=result)
                 else:
@@ -310,12 +430,15 @@ class JVLinkWrapper:
                     raise JVLinkError("JVRTOpen failed", error_code=result)
 
             self._is_open = True
+            self._read_complete = False
 
-            logger.info(
-                "JVRTOpen successful",
-                data_spec=data_spec,
-                read_count=read_count,
-            )
+            # Called per spec/key while polling real-time data
+            if is_enabled_for(__name__, logging.INFO):
+                logger.info(
+                    "JVRTOpen successful",
+                    data_spec=data_spec,
+                    read_count=read_count,
+                )
 
             return result, read_count
 
@@ -356,22 +479,22 @@ class JVLinkWrapper:
         """
         if not self._is_open:
             raise JVLinkError("JV-Link stream not open. Call jv_open() or jv_rt_open() first.")
+        if self._read_complete:
+            return JV_READ_SUCCESS, None, None
 
         try:
             # JVRead signature: JVRead(String buff, Long size, String filename)
             # Call with empty strings and buffer size
             # pywin32 returns 4-tuple: (return_code, buff_str, size_int, filename_str)
-            jv_result = self._jvlink.JVRead("", BUFFER_SIZE_JVREAD, "")
+            jv_result = self._jv_read("", BUFFER_SIZE_JVREAD, "")
 
             # Handle result - pywin32 returns (return_code, buff_str, size, filename_str)
-            if isinstance(jv_result, tuple) and len(jv_result) >= 4:
-                result = jv_result[0]
-                buff_str = jv_result[1]
-                # jv_result[2] is size (int) - not needed
-                filename_str = jv_result[3]
-            else:
+            # size (int) is not needed
+            try:
+                result, buff_str, _size, filename_str = jv_result
+            except (TypeError, ValueError):
                 # Unexpected return format
-                raise JVLinkError(f"Unexpected JVRead return format: {type(jv_result)}, length={len(jv_result) if isinstance(jv_result, tuple) else 'N/A'}")
+                raise JVLinkError(f"Unexpected JVRead return format: {type(jv_result)}")
 
             # Return code meanings:
             # > 0: Success, value is data length in bytes
@@ -398,82 +521,9 @@ class JVLinkWrapper:
                 # - Bytes 0x80-0x9F are C1 control characters in Unicode
                 # - These cannot be encoded as Shift-JIS, causing 'replace' to fail
                 # - This caused 99.7% of Japanese text data to be corrupted with '?'
-                if buff_str:
-                    # JV-Link COM returns Shift-JIS encoded data.
-                    # pywin32 may handle this in different ways:
-                    #
-                    # 1. Raw bytes as code points (0x00-0xFF) - ideal case
-                    #    -> Use latin-1 to extract bytes directly
-                    #
-                    # 2. Some bytes interpreted as CP1252 by Windows/pywin32
-                    #    -> Bytes 0x80-0x9F become Unicode chars like U+201C
-                    #    -> Need to convert these back to original bytes
-                    #
-                    # 3. Proper Unicode (Japanese chars as U+3000+)
-                    #    -> Encode to cp932 for parsers
-                    #
-                    # CP1252 to byte mapping for 0x80-0x9F range:
-                    CP1252_TO_BYTE = {
-                        0x20AC: 0x80,  # €
-                        0x201A: 0x82,  # ‚
-                        0x0192: 0x83,  # ƒ
-                        0x201E: 0x84,  # „
-                        0x2026: 0x85,  # …
-                        0x2020: 0x86,  # †
-                        0x2021: 0x87,  # ‡
-                        0x02C6: 0x88,  # ˆ
-                        0x2030: 0x89,  # ‰
-                        0x0160: 0x8A,  # Š
-                        0x2039: 0x8B,  # ‹
-                        0x0152: 0x8C,  # Œ
-                        0x017D: 0x8E,  # Ž
-                        0x2018: 0x91,  # '
-                        0x2019: 0x92,  # '
-                        0x201C: 0x93,  # "
-                        0x201D: 0x94,  # "
-                        0x2022: 0x95,  # •
-                        0x2013: 0x96,  # –
-                        0x2014: 0x97,  # —
-                        0x02DC: 0x98,  # ˜
-                        0x2122: 0x99,  # ™
-                        0x0161: 0x9A,  # š
-                        0x203A: 0x9B,  # ›
-                        0x0153: 0x9C,  # œ
-                        0x017E: 0x9E,  # ž
-                        0x0178: 0x9F,  # Ÿ
-                    }
-
-                    # 高速変換: 3段階のエンコード戦略
-                    # 1. Latin-1（ASCII + 拡張ASCII）- 最速
-                    # 2. CP932（日本語）- 高速
-                    # 3. 個別処理（CP1252変換が必要な場合）- 低速だが稀
-                    try:
-                        data_bytes = buff_str.encode('latin-1')
-                    except UnicodeEncodeError:
-                        try:
-                            # 日本語を含む場合はcp932で一括変換
-                            data_bytes = buff_str.encode('cp932')
-                        except UnicodeEncodeError:
-                            # CP1252変換が必要な文字が含まれる場合のみ個別処理
-                            result_bytes = bytearray()
-                            for c in buff_str:
-                                cp = ord(c)
-                                if cp <= 0xFF:
-                                    result_bytes.append(cp)
-                                elif cp in CP1252_TO_BYTE:
-                                    result_bytes.append(CP1252_TO_BYTE[cp])
-                                elif cp == 0xFFFD:
-                                    # Unicode replacement character - データ破損
-                                    # 数値フィールドでエラーを避けるため'0'に置換
-                                    result_bytes.append(0x30)  # '0'
-                                else:
-                                    try:
-                                        result_bytes.extend(c.encode('cp932'))
-                                    except UnicodeEncodeError:
-                                        result_bytes.append(0x3F)  # '?'
-                            data_bytes = bytes(result_bytes)
-                else:
-                    data_bytes = b""
+                # pywin32 may also hand back CP1252-interpreted or proper
+                # Unicode characters; see _bstr_to_bytes.
+                data_bytes = _bstr_to_bytes(buff_str) if buff_str else b""
 
                 # Note: Per-record debug logging removed to reduce verbosity
                 return result, data_bytes, filename_str
@@ -481,6 +531,7 @@ class JVLinkWrapper:
             elif result == JV_READ_SUCCESS:
                 # Read complete (0)
                 # Note: Debug log removed - this is logged at higher level in fetcher
+                self._read_complete = True
                 return result, None, None
 
             elif result == JV_READ_NO_MORE_DATA:
@@ -533,21 +584,22 @@ class JVLinkWrapper:
         """
         if not self._is_open:
             raise JVLinkError("JV-Link stream not open. Call jv_open() or jv_rt_open() first.")
+        if self._read_complete:
+            return JV_READ_SUCCESS, None
 
         try:
             # JVGets signature: JVGets(String buff, Long buffsize)
             # Call with empty string and buffer size
             # pywin32 returns tuple: (return_code, buff_str, buffsize)
-            jv_result = self._jvlink.JVGets("", BUFFER_SIZE_JVREAD)
+            jv_result = self._jv_gets("", BUFFER_SIZE_JVREAD)
 
             # Handle result - pywin32 returns (return_code, buff_str, buffsize)
-            if isinstance(jv_result, tuple) and len(jv_result) >= 2:
-                result = jv_result[0]
-                buff_str = jv_result[1]
-                # jv_result[2] is buffsize (int) - not needed
-            else:
+            # buffsize (int) is not needed
+            try:
+                result, buff_str, _buffsize = jv_result
+            except (TypeError, ValueError):
                 # Unexpected return format
-                raise JVLinkError(f"Unexpected JVGets return format: {type(jv_result)}, length={len(jv_result) if isinstance(jv_result, tuple) else 'N/A'}")
+                raise JVLinkError(f"Unexpected JVGets return format: {type(jv_result)}")
 
             # Return code meanings:
             # > 0: Success, value is data length in bytes
@@ -558,36 +610,14 @@ class JVLinkWrapper:
                 # Successfully read data (result is data length)
                 # JVGets returns Shift-JIS encoded byte array directly
                 # pywin32 may represent this as a string where each byte is a character
-                if buff_str:
-                    # Convert string to Shift-JIS bytes
-                    # JVGets stores Shift-JIS bytes in a BSTR, similar to JVRead
-                    # Use latin-1 encoding to extract raw bytes (1:1 mapping for 0x00-0xFF)
-                    try:
-                        data_bytes = buff_str.encode('latin-1')
-                    except UnicodeEncodeError:
-                        # If latin-1 fails, try cp932 encoding
-                        try:
-                            data_bytes = buff_str.encode('cp932')
-                        except UnicodeEncodeError:
-                            # Fallback: character-by-character conversion
-                            result_bytes = bytearray()
-                            for c in buff_str:
-                                cp = ord(c)
-                                if cp <= 0xFF:
-                                    result_bytes.append(cp)
-                                else:
-                                    try:
-                                        result_bytes.extend(c.encode('cp932'))
-                                    except UnicodeEncodeError:
-                                        result_bytes.append(0x3F)  # '?'
-                            data_bytes = bytes(result_bytes)
-                else:
-                    data_bytes = b""
+                # JVGets stores Shift-JIS bytes in a BSTR, similar to JVRead
+                data_bytes = _bstr_to_bytes(buff_str) if buff_str else b""
 
                 return result, data_bytes
 
             elif result == JV_READ_SUCCESS:
                 # Read complete (0)
+                self._read_complete = True
                 return result, None
 
             elif result == JV_READ_NO_MORE_DATA:
@@ -622,6 +652,7 @@ class JVLinkWrapper:
         try:
             result = self._jvlink.JVClose()
             self._is_open = False
+            self._read_complete = False
             logger.info("JV-Link stream closed")
             return result
         except Exception as e:
@@ -3,11 +3,25 @@
 This parser uses correct field positions calculated from schema field lengths.
 """
 
-from typing import List
+from typing import Tuple
 
 from src.parser.base import BaseParser, FieldDef
 
 
+_FIELDS = (
+    # JV-Data standard header fields
+    FieldDef("RecordSpec", 0, 2),      # Record type ID (positions 1-2)
+    FieldDef("DataKubun", 2, 1),       # Data type (position 3)
+    # Data fields
+    FieldDef("KettoNum", 3, 10),       # Horse registration number
+    FieldDef("SaleHostName", 13, 40),  # Sale host name
+    FieldDef("SaleName", 53, 80),      # Sale name
+    FieldDef("Price", 133, 10),        # Price
+    # Record delimiter at the end (last 2 bytes)
+    FieldDef("RecordDelimiter", 138, 2),  # Record delimiter (CRLF)
+)
+
+
 class AVParser(BaseParser):
     """Parser for AV record with accurate field positions.
 
@@ -17,21 +31,10 @@ class AVParser(BaseParser):
 
     record_type = "AV"
 
-    def _define_fields(self) -> List[FieldDef]:
+    def _define_fields(self) -> Tuple[FieldDef, ...]:
         """Define field positions calculated from schema.
 
         Returns:
-            List of FieldDef objects with type conversion settings
+            Tuple of FieldDef objects with type conversion settings
         """
-        return [
-            # JV-Data standard header fields
-            FieldDef("RecordSpec", 0, 2),      # Record type ID (positions 1-2)
-            FieldDef("DataKubun", 2, 1),       # Data type (position 3)
-            # Data fields
-            FieldDef("KettoNum", 3, 10),       # Horse registration number
-            FieldDef("SaleHostName", 13, 40),  # Sale host name
-            FieldDef("SaleName", 53, 80),      # Sale name
-            FieldDef("Price", 133, 10),        # Price
-            # Record delimiter at the end (last 2 bytes)
-            FieldDef("RecordDelimiter", 138, 2),  # Record delimiter (CRLF)
-        ]
+        return _FIELDS
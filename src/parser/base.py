@@ -3,17 +3,24 @@
 This module provides the base class for all JV-Data record parsers.
 """
 
+import struct
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from src.jvlink.constants import ENCODING_JVDATA
+from src.parser.converters import CONVERTERS, convert_value
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# slots=True needs Python 3.10+; on 3.9 FieldDef stays a regular dataclass
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class FieldDef:
     """Field definition for fixed-length record parsing.
 
@@ -67,16 +74,56 @@ class BaseParser(ABC):
         if not self.record_type:
             raise ValueError(f"{self.__class__.__name__} must define record_type")
 
-        # Get field definitions (may be tuples or FieldDef objects)
-        field_defs = self._define_fields()
+        # Resolve field definitions once per subclass and share them
+        # across instances (read from cls.__dict__ so subclasses don't
+        # inherit a parent's cache)
+        cls = type(self)
+        cached = cls.__dict__.get("_resolved_fields")
+        if cached is None:
+            cached = self._resolve_fields(self._define_fields())
+            cls._resolved_fields = cached
+            for problem in self._layout_problems(cached[0]):
+                logger.debug(
+                    f"{cls.__name__} field layout: {problem}",
+                    record_type=self.record_type,
+                )
+        self._fields, self._field_map, self._struct, self._converters = cached
+
+        logger.debug(
+            f"{self.__class__.__name__} initialized",
+            record_type=self.record_type,
+            field_count=len(self._fields),
+        )
+
+    @staticmethod
+    def _resolve_fields(
+        field_defs,
+    ) -> Tuple[
+        List[FieldDef],
+        Dict[str, FieldDef],
+        Optional[struct.Struct],
+        Tuple[Optional[Callable[[str], Any]], ...],
+    ]:
+        """Convert field definitions into FieldDef objects.
 
-        # Convert tuples to FieldDef objects if necessary
-        self._fields: List[FieldDef] = []
+        Args:
+            field_defs: FieldDef objects or legacy tuples (start, length, name)
+
+        Returns:
+            Tuple of (field list, field map keyed by name, record layout,
+            per-field converters). The layout is a struct.Struct that slices
+            every field in one call, or None if fields overlap or are out of
+            order.
+
+        Raises:
+            ValueError: If a field definition has an unsupported type
+        """
+        fields: List[FieldDef] = []
         for field_def in field_defs:
             if isinstance(field_def, tuple):
                 # Legacy format: (start, length, name)
                 start, length, name = field_def
-                self._fields.append(FieldDef(
+                fields.append(FieldDef(
                     name=name,
                     start=start - 1,  # Convert 1-indexed to 0-indexed
                     length=length,
@@ -84,24 +131,110 @@ class BaseParser(ABC):
                     description=""
                 ))
             elif isinstance(field_def, FieldDef):
-                self._fields.append(field_def)
+                fields.append(field_def)
             else:
                 raise ValueError(f"Invalid field definition type: {type(field_def)}")
 
-        self._field_map: Dict[str, FieldDef] = {f.name: f for f in self._fields}
-
-        logger.debug(
-            f"{self.__class__.__name__} initialized",
-            record_type=self.record_type,
-            field_count=len(self._fields),
+        return (
+            fields,
+            {f.name: f for f in fields},
+            BaseParser._build_struct(fields),
+            tuple(BaseParser._field_converter(f) for f in fields),
         )
 
+    @staticmethod
+    def _field_converter(field_def: FieldDef) -> Optional[Callable[[str], Any]]:
+        """Resolve the conversion function for a field.
+
+        Args:
+            field_def: Field definition
+
+        Returns:
+            Callable taking the stripped, non-empty field text, or None if
+            the text is kept as-is
+        """
+        if field_def.convert_type:
+            converter = CONVERTERS.get(field_def.convert_type.upper())
+            if converter is None:
+                # Unknown types raise ConversionError from convert_value
+                return partial(
+                    convert_value,
+                    target_type=field_def.convert_type,
+                    **field_def.converter_kwargs,
+                )
+            if field_def.converter_kwargs:
+                return partial(converter, **field_def.converter_kwargs)
+            return converter
+
+        # Legacy type conversion (for backward compatibility)
+        if field_def.type == "int":
+            return int
+        if field_def.type == "float":
+            return float
+        return None
+
+    @staticmethod
+    def _layout_problems(fields: List[FieldDef]) -> List[str]:
+        """Find schema mistakes in a field layout.
+
+        Overlapping or out-of-order fields usually mean an off-by-one in
+        a generated schema, and duplicate names silently drop a value from
+        the parsed dict.
+
+        Args:
+            fields: Field definitions in record order
+
+        Returns:
+            Human-readable descriptions of each problem found
+        """
+        problems = []
+        seen = set()
+        previous: Optional[FieldDef] = None
+        for f in fields:
+            if f.name in seen:
+                problems.append(f"duplicate field name {f.name}")
+            seen.add(f.name)
+            if f.length <= 0:
+                problems.append(f"{f.name} has non-positive length {f.length}")
+            if previous is not None and f.start < previous.start + previous.length:
+                problems.append(
+                    f"{f.name} starts at {f.start}, inside {previous.name} "
+                    f"({previous.start}-{previous.start + previous.length})"
+                )
+            previous = f
+        return problems
+
+    @staticmethod
+    def _build_struct(fields: List[FieldDef]) -> Optional[struct.Struct]:
+        """Build a struct layout for ordered, non-overlapping fields.
+
+        Args:
+            fields: Field definitions in record order
+
+        Returns:
+            struct.Struct unpacking one bytes value per field (gaps are
+            skipped with padding), or None if the layout can't be expressed
+        """
+        fmt = ["="]
+        pos = 0
+        for f in fields:
+            if f.start < pos or f.length < 0:
+                return None
+            if f.start > pos:
+                fmt.append(f"{f.start - pos}x")
+            fmt.append(f"{f.length}s")
+            pos = f.start + f.length
+        return struct.Struct("".join(fmt))
+
     @abstractmethod
-    def _define_fields(self) -> List:
+    def _define_fields(self) -> Sequence:
         """Define fields for this record type.
 
+        Called once per subclass; the resolved definitions are cached on the
+        class and shared by all instances.
+
         Returns:
-            List of FieldDef objects or tuples (start, length, name) defining the record structure
+            Sequence of FieldDef objects or tuples (start, length, name) defining the record structure
         """
         pass
 
@@ -126,92 +259,53 @@ class BaseParser(ABC):
         if not record:
             raise ValueError("Empty record")
 
-        # Decode record from Shift_JIS
-        # Use errors='replace' to handle invalid byte sequences gracefully
-        # instead of throwing an exception. Invalid sequences are replaced with '�'.
-        # This prevents data loss while preserving field positions.
-        try:
-            record_str = record.decode(ENCODING_JVDATA, errors='replace')
-        except UnicodeDecodeError as e:
-            # Fallback if errors='replace' somehow still fails
-            logger.warning(f"Failed to decode record with replacement: {e}")
-            raise ValueError(f"Failed to decode record: {e}")
-
         # Verify record type
-        actual_type = record_str[:2]
+        actual_type = record[:2].decode(ENCODING_JVDATA, errors='replace')
         if actual_type != self.record_type:
             raise ValueError(
                 f"Record type mismatch: expected {self.record_type}, got {actual_type}"
             )
 
+        # Field positions are byte offsets, so slice before decoding.
+        # A full-length record is split in one unpack_from call; short
+        # records and overlapping layouts fall back to per-field slicing.
+        if self._struct is not None and len(record) >= self._struct.size:
+            raw_values = self._struct.unpack_from(record)
+        else:
+            raw_values = [record[f.start:f.start + f.length] for f in self._fields]
+
         # Parse all fields
         result = {}
-        for field_def in self._fields:
-            try:
-                value = self._extract_field(record_str, field_def)
-                result[field_def.name] = value
-            except Exception as e:
-                logger.warning(
-                    f"Failed to parse field {field_def.name}",
-                    field=field_def.name,
-                    error=str(e),
-                )
+        for field_def, converter, raw_value in zip(self._fields, self._converters, raw_values):
+            # Codes, numbers and padding are plain ASCII, which decodes far
+            # faster than going through the cp932 codec. Otherwise use
+            # errors='replace' so invalid Shift_JIS sequences become '\ufffd'
+            # instead of failing the whole record.
+            if raw_value.isascii():
+                value = raw_value.decode('ascii').strip()
+            else:
+                value = raw_value.decode(ENCODING_JVDATA, errors='replace').strip()
+            if not value:
+                # Every converter maps blank text to None
                 result[field_def.name] = None
+            elif converter is None:
+                result[field_def.name] = value
+            else:
+                try:
+                    result[field_def.name] = converter(value)
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to convert field {field_def.name}: {e}",
+                        field=field_def.name,
+                        value=value,
+                        target_type=field_def.convert_type or field_def.type,
+                    )
+                    result[field_def.name] = None
 
         # Note: Per-record debug logging removed to reduce verbosity during batch processing
 
         return result
 
-    def _extract_field(self, record: str, field_def: FieldDef) -> Any:
-        """Extract a single field from the record.
-
-        Args:
-            record: Decoded record string
-            field_def: Field definition
-
-        Returns:
-            Parsed field value
-        """
-        end = field_def.start + field_def.length
-        raw_value = record[field_def.start:end]
-
-        # Strip whitespace
-        value = raw_value.strip()
-
-        # Use new convert_type if specified
-        if field_def.convert_type:
-            try:
-                from src.parser.converters import convert_value
-                return convert_value(value, field_def.convert_type, **field_def.converter_kwargs)
-            except Exception as e:
-                logger.warning(
-                    f"Failed to convert field {field_def.name} to {field_def.convert_type}: {e}",
-                    field=field_def.name,
-                    value=value,
-                    target_type=field_def.convert_type,
-                )
-                return None
-
-        # Legacy type conversion (for backward compatibility)
-        if field_def.type == "int" and value:
-            try:
-                return int(value)
-            except ValueError:
-                logger.warning(
-                    f"Failed to convert field to int: {field_def.name}={value}"
-                )
-                return None
-        elif field_def.type == "float" and value:
-            try:
-                return float(value)
-            except ValueError:
-                logger.warning(
-                    f"Failed to convert field to float: {field_def.name}={value}"
-                )
-                return None
-
-        return value if value else None
-
     def get_field_names(self) -> List[str]:
         """Get list of all field names.
 
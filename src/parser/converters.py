@@ -4,9 +4,12 @@ This module provides conversion functions to transform JV-Data fixed-length
 text fields into appropriate Python/database types.
 """
 
+import re
+import sys
 from datetime import date, time, datetime
-from decimal import Decimal, InvalidOperation
-from typing import Any, Optional, Union
+from decimal import Decimal
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Union
 
 
 class ConversionError(Exception):
@@ -14,6 +17,50 @@ class ConversionError(Exception):
     pass
 
 
+# Blank (after strip) and all-zero dates mean "no date" in JV-Data
+_NULL_DATES = frozenset({"", "00000000"})
+
+# date.fromisoformat accepts the basic YYYYMMDD form from Python 3.11
+_ISO_BASIC_DATES = sys.version_info >= (3, 11)
+
+# MMDD with month 01-12 and day 01-31, validated in a single match
+_MONTH_DAY_RE = re.compile(r"(0[1-9]|1[0-2])(0[1-9]|[12][0-9]|3[01])")
+
+# Dates and times repeat heavily within a JV-Data file (e.g. MakeDate is
+# shared by a whole batch), so their conversions are memoized per raw value.
+_CONVERTER_CACHE_SIZE = 65536
+_CONVERTER_CACHES: List[Dict[str, Any]] = []
+_MISSING = object()
+
+
+def _cached_by_value(func: Callable[[str], Any]) -> Callable[[str], Any]:
+    """Memoize a single-argument converter on its raw input string.
+
+    Successful results (including None) are cached until the cache holds
+    _CONVERTER_CACHE_SIZE entries; values that raise are never cached.
+    """
+    cache: Dict[str, Any] = {}
+    _CONVERTER_CACHES.append(cache)
+
+    @wraps(func)
+    def wrapper(value: str) -> Any:
+        result = cache.get(value, _MISSING)
+        if result is _MISSING:
+            result = func(value)
+            if len(cache) < _CONVERTER_CACHE_SIZE:
+                cache[value] = result
+        return result
+
+    return wrapper
+
+
+def clear_converter_caches() -> None:
+    """Clear memoized date/time/month-day conversions."""
+    for cache in _CONVERTER_CACHES:
+        cache.clear()
+
+
+@_cached_by_value
 def to_date(value: str) -> Optional[date]:
     """Convert YYYYMMDD string to date.
 
@@ -31,31 +78,30 @@ def to_date(value: str) -> Optional[date]:
         >>> to_date("")
         None
     """
-    if not value or not value.strip() or value.strip() == "0" * 8:
+    if not value:
         return None
 
     value = value.strip()
-    if len(value) != 8:
+    if value in _NULL_DATES:
+        return None
+    if len(value) != 8 or not value.isdigit():
         raise ConversionError(f"Invalid date format: {value} (expected YYYYMMDD)")
 
     try:
-        year = int(value[0:4])
-        month = int(value[4:6])
-        day = int(value[6:8])
-
-        # Validate date components
-        if year < 1900 or year > 2100:
-            raise ConversionError(f"Invalid year: {year}")
-        if month < 1 or month > 12:
-            raise ConversionError(f"Invalid month: {month}")
-        if day < 1 or day > 31:
-            raise ConversionError(f"Invalid day: {day}")
-
-        return date(year, month, day)
-    except (ValueError, IndexError) as e:
+        # fromisoformat validates month/day (including leap years) in C
+        if _ISO_BASIC_DATES:
+            result = date.fromisoformat(value)
+        else:
+            result = date.fromisoformat(f"{value[0:4]}-{value[4:6]}-{value[6:8]}")
+    except ValueError as e:
         raise ConversionError(f"Failed to convert '{value}' to date: {e}")
 
+    if result.year < 1900 or result.year > 2100:
+        raise ConversionError(f"Invalid year: {result.year}")
+    return result
+
 
+@_cached_by_value
 def to_time(value: str) -> Optional[time]:
     """Convert HHMM string to time.
 
@@ -73,10 +119,12 @@ def to_time(value: str) -> Optional[time]:
         >>> to_time("")
         None
     """
-    if not value or not value.strip():
+    if not value:
         return None
 
     value = value.strip()
+    if not value:
+        return None
 
     # 4桁: HHMM形式（時分のみ）
     # 8桁: MMDDHHMM形式（発表月日時分）- 末尾4桁を使用
@@ -121,15 +169,16 @@ def to_int(value: str) -> Optional[int]:
         >>> to_int("   ")
         None
     """
-    if not value or not value.strip():
+    if not value:
+        return None
+
+    value = value.strip()
+    if not value:
         return None
 
     try:
-        return int(value.strip())
+        return int(value)
     except ValueError:
-        # Check if all zeros
-        if value.strip() == "0" * len(value.strip()):
-            return 0
         raise ConversionError(f"Failed to convert '{value}' to int")
 
 
@@ -156,18 +205,29 @@ def to_decimal(value: str, decimal_places: int = 1) -> Optional[Decimal]:
         >>> to_decimal("")
         None
     """
-    if not value or not value.strip():
+    if not value:
+        return None
+    value = value.strip()
+    if not value:
         return None
 
-    try:
-        int_value = int(value.strip())
+    if decimal_places <= 0:
+        try:
+            return Decimal(int(value))
+        except ValueError:
+            raise ConversionError(f"Failed to convert '{value}' to Decimal")
 
-        # Divide by 10^decimal_places
-        divisor = 10 ** decimal_places
-        return Decimal(int_value) / Decimal(divisor)
-    except (ValueError, InvalidOperation):
+    # Only an optionally signed run of ASCII digits may be spliced; anything
+    # else ("-", "1E5", "1.5") would parse as a different number or not at all
+    unsigned = value[1:] if value[0] in "+-" else value
+    if not (unsigned.isascii() and unsigned.isdigit()):
         raise ConversionError(f"Failed to convert '{value}' to Decimal")
 
+    # Insert the decimal point into the digit string ("1234" -> "123.4")
+    # so Decimal parses it directly instead of dividing by 10^decimal_places
+    digits = value.zfill(decimal_places + 1)
+    return Decimal(f"{digits[:-decimal_places]}.{digits[-decimal_places:]}")
+
 
 def to_race_time(value: str) -> Optional[Decimal]:
     """Convert race time string to Decimal (seconds).
@@ -269,6 +329,7 @@ def to_prize_money(value: str) -> Optional[int]:
     return to_int(value)
 
 
+@_cached_by_value
 def to_month_day(value: str) -> Optional[int]:
     """Convert MMDD string to integer.
 
@@ -286,25 +347,16 @@ def to_month_day(value: str) -> Optional[int]:
         >>> to_month_day("1231")
         1231
     """
-    if not value or not value.strip() or value.strip() == "0" * 4:
+    if not value:
         return None
 
     value = value.strip()
-    if len(value) != 4:
-        raise ConversionError(f"Invalid month-day format: {value} (expected MMDD)")
-
-    try:
-        month = int(value[0:2])
-        day = int(value[2:4])
-
-        if month < 1 or month > 12:
-            raise ConversionError(f"Invalid month: {month}")
-        if day < 1 or day > 31:
-            raise ConversionError(f"Invalid day: {day}")
+    if not value or value == "0000":
+        return None
+    if _MONTH_DAY_RE.fullmatch(value) is None:
+        raise ConversionError(f"Invalid month-day: {value} (expected MMDD)")
 
-        return int(value)
-    except (ValueError, IndexError) as e:
-        raise ConversionError(f"Failed to convert '{value}' to month-day: {e}")
+    return int(value)
 
 
 # Type converter registry
@@ -346,11 +398,14 @@ def convert_value(value: str, target_type: str, **kwargs) -> Any:
         >>> convert_value("550", "WEIGHT")
         Decimal('55.0')
     """
-    converter = CONVERTERS.get(target_type.upper())
+    # Registry keys are uppercase; only normalize when the exact key misses
+    converter = CONVERTERS.get(target_type) or CONVERTERS.get(target_type.upper())
     if not converter:
         raise ConversionError(f"Unknown converter type: {target_type}")
 
     try:
-        return converter(value, **kwargs)
+        return converter(value, **kwargs) if kwargs else converter(value)
+    except ConversionError:
+        raise
     except Exception as e:
         raise ConversionError(f"Conversion failed for '{value}' to {target_type}: {e}")
@@ -7,7 +7,7 @@ Auto-generated parsers based on: 公式JV-Data仕様書 Ver.4.9.0.1
 """
 
 import importlib
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -42,6 +42,8 @@ class ParserFactory:
         """Initialize parser factory with dynamic parser loading."""
         self._parsers: Dict[str, any] = {}
         self._parser_classes: Dict[str, any] = {}
+        # Raw 2-byte record spec -> bound parse method (None if unsupported)
+        self._dispatch: Dict[bytes, Optional[Callable[[bytes], Optional[dict]]]] = {}
 
         logger.info("ParserFactory initialized", total_types=len(ALL_RECORD_TYPES))
 
@@ -145,15 +147,17 @@ class ParserFactory:
 
         try:
             # Auto-detect record type from first 2 bytes
-            record_type = record[:2].decode("ascii")
-            parser = self.get_parser(record_type)
-
-            if not parser:
-                logger.warning(f"No parser available for record type: {record_type}")
+            spec = record[:2]
+            try:
+                parse_fn = self._dispatch[spec]
+            except KeyError:
+                parse_fn = self._resolve(spec)
+
+            if parse_fn is None:
+                logger.warning(f"No parser available for record type: {spec!r}")
                 return None
 
-            parsed_result = parser.parse(record)
-            return parsed_result
+            return parse_fn(record)
 
         except UnicodeDecodeError:
             logger.error("Failed to decode record type")
@@ -162,6 +166,26 @@ class ParserFactory:
             logger.error(f"Failed to parse record", error=str(e))
             return None
 
+    def _resolve(self, spec: bytes) -> Optional[Callable[[bytes], Optional[dict]]]:
+        """Look up and remember the parse method for a raw record spec.
+
+        Unsupported specs are remembered as None so they are not re-imported
+        for every record.
+
+        Args:
+            spec: First two bytes of a record
+
+        Returns:
+            Bound ``parse`` method, or None if the type is not supported
+
+        Raises:
+            UnicodeDecodeError: If the spec is not ASCII
+        """
+        parser = self.get_parser(spec.decode("ascii"))
+        parse_fn = parser.parse if parser else None
+        self._dispatch[spec] = parse_fn
+        return parse_fn
+
     def __repr__(self) -> str:
         """String representation."""
         return f"<ParserFactory types={len(ALL_RECORD_TYPES)} cached={len(self._parsers)}>"
@@ -31,6 +31,9 @@ class TMParser:
     def decode_field(data: bytes) -> str:
         """バイトデータをデコードして文字列に変換"""
         try:
+            # 数値・コード項目はASCIIのみなので、cp932コーデックを通さずにデコード
+            if data.isascii():
+                return data.decode("ascii").strip()
             # CP932でデコード、空白を除去
             return data.decode("cp932", errors="replace").strip()
         except Exception:
@@ -332,7 +332,7 @@ class RealtimeMonitor:
                     f"Creating {len(missing_tables)} missing tables",
                     tables=missing_tables
                 )
-                schema_mgr.create_all_tables()
+                schema_mgr.create_tables(missing_tables)
 
         except Exception as e:
             logger.warning(f"Could not create tables: {e}")
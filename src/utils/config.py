@@ -2,11 +2,18 @@
 
 import os
 import re
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
+# Use the libyaml-backed loader when available
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# In-process cache: resolved path -> ((path, mtime_ns, size), parsed document)
+_yaml_memo: Dict[str, Tuple[tuple, Any]] = {}
+
 
 class ConfigError(Exception):
     """Configuration error exception."""
@@ -149,6 +156,39 @@ def _validate_config(config: Dict[str, Any]) -> None:
         raise ConfigError("Invalid JV-Link service key")
 
 
+def _read_yaml_cached(config_path: Path) -> Any:
+    """Read a YAML file, reusing the previous parse result when unchanged.
+
+    The raw (pre-expansion) YAML document is cached in memory for this
+    process, keyed by the file's mtime and size. Nothing is written to disk,
+    so secrets in the file are not copied anywhere. Environment variables
+    are expanded after loading (into new containers), so the cached document
+    is never modified and never holds values taken from the environment.
+
+    Args:
+        config_path: Path to the YAML file
+
+    Returns:
+        Parsed YAML document
+
+    Raises:
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    stat = config_path.stat()
+    resolved = str(config_path.resolve())
+    key = (resolved, stat.st_mtime_ns, stat.st_size)
+
+    memo = _yaml_memo.get(resolved)
+    if memo is not None and memo[0] == key:
+        return memo[1]
+
+    with open(config_path, "r", encoding="utf-8") as f:
+        doc = yaml.load(f, Loader=_YamlLoader)
+
+    _yaml_memo[resolved] = (key, doc)
+    return doc
+
+
 def load_config(config_path: Optional[str] = None) -> Config:
     """Load configuration from YAML file.
 
@@ -177,8 +217,7 @@ def load_config(config_path: Optional[str] = None) -> Config:
         raise ConfigError(f"Configuration file not found: {config_path}")
 
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            config_dict = yaml.safe_load(f)
+        config_dict = _read_yaml_cached(config_path)
     except yaml.YAMLError as e:
         raise ConfigError(f"Invalid YAML in configuration file: {e}")
 
@@ -194,6 +233,37 @@ def load_config(config_path: Optional[str] = None) -> Config:
     return Config(config_dict)
 
 
+def write_text_atomic(path, text: str) -> None:
+    """Write text to a file atomically.
+
+    The content is written to a temporary file in the same directory and
+    then moved into place with ``os.replace``, so an interrupted write never
+    leaves a truncated file behind.
+
+    Args:
+        path: Destination file path
+        text: File content (written as UTF-8)
+    """
+    _write_atomic(Path(path), text.encode("utf-8"))
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write bytes to a file via tempfile + os.replace."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def get_default_config() -> Dict[str, Any]:
     """Get default configuration values.
 
@@ -121,6 +121,28 @@ def get_logger(name: str) -> structlog.BoundLogger:
     return structlog.get_logger(name)
 
 
+def is_enabled_for(name: str, level: int) -> bool:
+    """Check whether a logger would emit records at the given level.
+
+    structlog builds the event dict (and the keyword arguments passed to it)
+    before ``filter_by_level`` drops the event, so hot paths should check
+    this once and skip logging calls that would be filtered anyway.
+
+    Args:
+        name: Logger name (typically __name__)
+        level: Standard logging level (e.g., logging.DEBUG)
+
+    Returns:
+        True if records at ``level`` are processed by the logger
+
+    Examples:
+        >>> debug = is_enabled_for(__name__, logging.DEBUG)
+        >>> if debug:
+        ...     logger.debug("Skipping record", record_num=n)
+    """
+    return logging.getLogger(name).isEnabledFor(level)
+
+
 def setup_logging_from_config(config: dict) -> None:
     """Setup logging from configuration dictionary.
 
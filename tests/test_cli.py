@@ -2,7 +2,11 @@
 # -*- coding: utf-8 -*-
 """Tests for CLI commands."""
 
+import io
+import subprocess
+import sys
 import tempfile
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -148,6 +152,27 @@ jvlink:
             # Should attempt to execute (may succeed or fail, but command should parse)
             self.assertIsNotNone(result)
 
+    def test_create_tables_quiet(self):
+        """Test that --quiet drops the banner but keeps the results."""
+        with self.runner.isolated_filesystem():
+            Path('config.yaml').write_text("""
+jvlink:
+  service_key: ""
+databases:
+  sqlite:
+    enabled: true
+    path: data/test.db
+""")
+
+            result = self.runner.invoke(cli, [
+                '--config', 'config.yaml', '--quiet',
+                'create-tables', '--db', 'sqlite', '--nl-only',
+            ])
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertNotIn('Creating database tables', result.output)
+            self.assertIn('Created', result.output)
+
 
 class TestFetchCommand(unittest.TestCase):
     """Test fetch command."""
@@ -211,6 +236,48 @@ jvlink:
             # Just verify command structure works
             self.assertIsNotNone(result)
 
+    @patch('src.importer.batch.BatchProcessor')
+    def test_fetch_multiple_specs_single_processor(self, mock_batch_processor):
+        """Test that --specs fetches every spec with one processor."""
+        mock_processor_instance = MagicMock()
+        mock_processor_instance.process_date_range.return_value = {
+            'records_fetched': 1,
+            'records_parsed': 1,
+            'records_imported': 1,
+            'records_failed': 0,
+        }
+        mock_batch_processor.return_value = mock_processor_instance
+
+        with self.runner.isolated_filesystem():
+            Path('config.yaml').write_text("""
+jvlink:
+  service_key: "${JVLINK_SERVICE_KEY}"
+databases:
+  sqlite:
+    enabled: true
+    path: data/test.db
+""")
+            Path('data').mkdir()
+
+            result = self.runner.invoke(cli, [
+                '--config', 'config.yaml',
+                'fetch',
+                '--from', '20240101',
+                '--to', '20240131',
+                '--specs', 'RACE,DIFF',
+                '--db', 'sqlite',
+                '--no-progress',
+            ], obj={})
+
+            self.assertEqual(result.exit_code, 0, result.output)
+            mock_batch_processor.assert_called_once()
+            specs = [
+                c.kwargs['data_spec']
+                for c in mock_processor_instance.process_date_range.call_args_list
+            ]
+            self.assertEqual(specs, ['RACE', 'DIFF'])
+            self.assertIn('Statistics (DIFF)', result.output)
+
 
 class TestMonitorCommand(unittest.TestCase):
     """Test monitor command."""
@@ -255,6 +322,31 @@ jvlink:
             # Should execute (may fail due to config/JV-Link, but command structure should work)
             self.assertIsNotNone(result)
 
+    @patch('src.realtime.monitor.RealtimeMonitor')
+    def test_monitor_foreground_stops_on_ctrl_c(self, mock_monitor):
+        """Test that Ctrl+C in foreground mode stops the monitor cleanly."""
+        mock_monitor_instance = MagicMock()
+        mock_monitor.return_value = mock_monitor_instance
+
+        with self.runner.isolated_filesystem(), \
+                patch('time.sleep', side_effect=KeyboardInterrupt):
+            Path('config.yaml').write_text("""
+jvlink:
+  service_key: ""
+databases:
+  sqlite:
+    enabled: true
+    path: data/test.db
+""")
+            result = self.runner.invoke(cli, [
+                '--config', 'config.yaml', 'monitor', '--db', 'sqlite',
+            ])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        mock_monitor_instance.start.assert_called_once_with(daemon=False)
+        mock_monitor_instance.stop.assert_called_once()
+        self.assertIn('Monitor stopped', result.output)
+
 
 class TestExportCommand(unittest.TestCase):
     """Test export command."""
@@ -472,5 +564,167 @@ logging:
             self.assertEqual(result.exit_code, 0)
 
 
+class TestDaemonCommand(unittest.TestCase):
+    """Test daemon/client command dispatch."""
+
+    @unittest.skipIf(sys.platform == 'win32', 'uses a UNIX socket')
+    def test_client_runs_command_on_daemon(self):
+        """Test that a client request runs in the daemon process."""
+        from src.cli import daemon
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            address = str(Path(tmpdir) / 'jltsql.sock')
+            # Run the daemon in its own process, as in real use
+            server = subprocess.Popen([
+                sys.executable, '-c',
+                'import sys; from src.cli.main import cli; '
+                'from src.cli import daemon; daemon.serve(cli, sys.argv[1])',
+                address,
+            ])
+            try:
+                for _ in range(200):
+                    if Path(address).exists():
+                        break
+                    time.sleep(0.05)
+
+                with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+                    code = daemon.send_command(['version'], address)
+
+                self.assertEqual(code, 0)
+                self.assertIn('JLTSQL version', stdout.getvalue())
+            finally:
+                daemon.shutdown(address)
+                server.wait(timeout=10)
+
+            self.assertEqual(server.returncode, 0)
+
+    def test_client_context_uses_client_cwd_and_env(self):
+        """Test that requests run in the client's directory and environment."""
+        import os
+        from src.cli import daemon
+
+        old_cwd = os.getcwd()
+        old_environ = dict(os.environ)
+        with tempfile.TemporaryDirectory() as tmpdir, \
+                patch.dict(os.environ, {'JLTSQL_DAEMON_ONLY': 'daemon'}):
+            request = {
+                'cwd': tmpdir,
+                'env': {'JLTSQL_TEST_VAR': 'client', 'UNRELATED_SECRET': 'x'},
+            }
+            with daemon._client_context(request):
+                self.assertEqual(Path(os.getcwd()).resolve(), Path(tmpdir).resolve())
+                self.assertEqual(os.environ['JLTSQL_TEST_VAR'], 'client')
+                # Only forwarded variables are taken from the client
+                self.assertNotIn('JLTSQL_DAEMON_ONLY', os.environ)
+                self.assertNotIn('UNRELATED_SECRET', os.environ)
+                # Prompts must not read the daemon's terminal
+                self.assertEqual(sys.stdin.read(), '')
+
+        self.assertEqual(os.getcwd(), old_cwd)
+        self.assertEqual(dict(os.environ), old_environ)
+
+    def test_client_env_only_forwards_cli_variables(self):
+        """Test that the client does not send its whole environment."""
+        import os
+        from src.cli import daemon
+
+        with patch.dict(os.environ, {'PGPASSWORD': 'pw', 'AWS_SECRET_ACCESS_KEY': 'x'}):
+            env = daemon._client_env()
+
+        self.assertEqual(env['PGPASSWORD'], 'pw')
+        self.assertNotIn('AWS_SECRET_ACCESS_KEY', env)
+
+    def test_unexpected_command_error_does_not_escape(self):
+        """Test that an exception from a command becomes exit code 1."""
+        import click
+        from src.cli import daemon
+
+        @click.command()
+        def broken():
+            raise RuntimeError('database went away')
+
+        with patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            code = daemon._run_command(broken, [])
+
+        self.assertEqual(code, 1)
+        self.assertIn('RuntimeError: database went away', stderr.getvalue())
+
+    def test_client_reports_dead_daemon(self):
+        """Test that a daemon dying mid-command gives a non-zero exit."""
+        from src.cli import daemon
+
+        conn = MagicMock()
+        conn.__enter__.return_value = conn
+        conn.recv.side_effect = EOFError
+        with patch.object(daemon, '_connect', return_value=conn), \
+                patch('sys.stderr', new_callable=io.StringIO) as stderr:
+            code = daemon.send_command(['version'])
+
+        self.assertEqual(code, 1)
+        self.assertIn('lost connection', stderr.getvalue())
+
+    @unittest.skipIf(sys.platform == 'win32', 'uses a UNIX socket')
+    def test_client_refuses_shared_socket_directory(self):
+        """Test that the client does not connect through a directory others can write."""
+        import os
+        import click
+        from src.cli import daemon
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.chmod(tmpdir, 0o777)
+            with self.assertRaises(click.ClickException):
+                daemon.send_command(['version'], str(Path(tmpdir) / 'jltsql.sock'))
+
+
+class TestDatabaseReuse(unittest.TestCase):
+    """Test handler caching while the daemon serves commands."""
+
+    def setUp(self):
+        """Enable reuse as 'jltsql daemon' does."""
+        from src.cli import main
+        self.main = main
+        main._enable_database_reuse()
+        self.addCleanup(setattr, main, '_database_cache', None)
+        # Handler classes return a fresh mock per instance
+        module = MagicMock(**{
+            class_name: MagicMock(side_effect=lambda config: MagicMock())
+            for _, class_name in main._DATABASE_HANDLERS.values()
+        })
+        patcher = patch('src.cli.main.importlib.import_module', return_value=module)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_file_databases_not_cached(self):
+        """Test that DuckDB and SQLite handlers are not kept open."""
+        for db_type in ('duckdb', 'sqlite'):
+            first = self.main._make_database(db_type, None)
+            second = self.main._make_database(db_type, None)
+            self.assertIsNot(first, second)
+        self.assertEqual(self.main._database_cache, {})
+
+    def test_postgresql_reused_while_alive(self):
+        """Test that a live PostgreSQL handler is returned again."""
+        config = MagicMock(**{'get.return_value': {'host': 'localhost'}})
+
+        first = self.main._make_database('postgresql', config)
+        second = self.main._make_database('postgresql', config)
+
+        self.assertIs(first, second)
+        self.assertIs(first.keep_alive, True)
+        first.fetch_one.assert_called_once_with('SELECT 1')
+
+    def test_postgresql_reconnects_after_dropped_connection(self):
+        """Test that a dead cached connection is replaced."""
+        config = MagicMock(**{'get.return_value': {'host': 'localhost'}})
+
+        first = self.main._make_database('postgresql', config)
+        first.fetch_one.side_effect = Exception('server closed the connection')
+        second = self.main._make_database('postgresql', config)
+
+        self.assertIsNot(first, second)
+        first.disconnect.assert_called_once()
+        self.assertIs(self.main._make_database('postgresql', config), second)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for configuration loading."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.utils import config as config_module
+from src.utils.config import load_config, write_text_atomic
+
+CONFIG_YAML = """\
+jvlink:
+  service_key: "${TEST_JVLINK_KEY:DEFAULTKEY00}"
+databases:
+  sqlite:
+    enabled: true
+    path: "./data/keiba.db"
+"""
+
+
+class TestLoadConfigCache(unittest.TestCase):
+    """Test the parsed-config cache used by load_config."""
+
+    def setUp(self):
+        """Set up a temporary config file."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.config_path = self.root / "config.yaml"
+        self.config_path.write_text(CONFIG_YAML, encoding="utf-8")
+        self.addCleanup(self.tmpdir.cleanup)
+        config_module._yaml_memo.clear()
+        self.addCleanup(config_module._yaml_memo.clear)
+
+    def test_in_process_cache_skips_parse(self):
+        """Repeated loads in one process should not re-parse the file."""
+        load_config(str(self.config_path))
+
+        with patch.object(config_module.yaml, "load") as mock_yaml_load:
+            cfg = load_config(str(self.config_path))
+            mock_yaml_load.assert_not_called()
+
+        self.assertEqual(cfg.get("databases.sqlite.path"), "./data/keiba.db")
+
+    def test_cache_writes_nothing_to_disk(self):
+        """The parsed config (and any secrets in it) stays in memory."""
+        load_config(str(self.config_path))
+
+        self.assertEqual(os.listdir(self.root), ["config.yaml"])
+
+    def test_cache_invalidated_on_change(self):
+        """Modifying the file should invalidate the cached parse."""
+        load_config(str(self.config_path))
+
+        self.config_path.write_text(
+            CONFIG_YAML.replace("./data/keiba.db", "./data/other.db"), encoding="utf-8"
+        )
+        cfg = load_config(str(self.config_path))
+
+        self.assertEqual(cfg.get("databases.sqlite.path"), "./data/other.db")
+
+    def test_env_vars_expanded_after_cache(self):
+        """Environment variables should be expanded on every load."""
+        load_config(str(self.config_path))
+
+        with patch.dict(os.environ, {"TEST_JVLINK_KEY": "FROMENVIRONMENT"}):
+            cfg = load_config(str(self.config_path))
+
+        self.assertEqual(cfg.get("jvlink.service_key"), "FROMENVIRONMENT")
+
+
+class TestWriteTextAtomic(unittest.TestCase):
+    """Test atomic file writes."""
+
+    def test_replaces_content_without_leftovers(self):
+        """Existing file is replaced and no temp file is left behind."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "config.yaml"
+            path.write_text("old", encoding="utf-8")
+
+            write_text_atomic(path, "新しい設定")
+
+            self.assertEqual(path.read_text(encoding="utf-8"), "新しい設定")
+            self.assertEqual(os.listdir(tmpdir), ["config.yaml"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,6 +18,7 @@ from src.parser.converters import (
     to_prize_money,
     to_month_day,
     convert_value,
+    clear_converter_caches,
     ConversionError,
 )
 
@@ -60,6 +61,12 @@ class TestDateConversion(unittest.TestCase):
         with self.assertRaises(ConversionError):
             to_date("20230229")  # Invalid leap year date
 
+        with self.assertRaises(ConversionError):
+            to_date("2023W015")  # ISO week date, not YYYYMMDD
+
+        with self.assertRaises(ConversionError):
+            to_date("18991231")  # Year out of range
+
 
 class TestTimeConversion(unittest.TestCase):
     """Test time conversion functions."""
@@ -132,6 +139,9 @@ class TestDecimalConversion(unittest.TestCase):
         """Test decimal conversion with different decimal places."""
         self.assertEqual(to_decimal("12345", 2), Decimal("123.45"))
         self.assertEqual(to_decimal("12345", 3), Decimal("12.345"))
+        self.assertEqual(to_decimal("5", 3), Decimal("0.005"))
+        self.assertEqual(to_decimal("-5", 2), Decimal("-0.05"))
+        self.assertEqual(to_decimal("12", 0), Decimal("12"))
 
     def test_to_decimal_zero(self):
         """Test decimal conversion of zero."""
@@ -143,6 +153,14 @@ class TestDecimalConversion(unittest.TestCase):
         with self.assertRaises(ConversionError):
             to_decimal("abc", 1)
 
+        with self.assertRaises(ConversionError):
+            to_decimal("1.5", 1)  # Already has a decimal point
+
+        # Bare signs and exponents are not digit strings
+        for value in ("-", "+", "1E5", "+-5"):
+            with self.assertRaises(ConversionError):
+                to_decimal(value, 2)
+
 
 class TestRaceTimeConversion(unittest.TestCase):
     """Test race time conversion."""
@@ -245,6 +263,12 @@ class TestMonthDayConversion(unittest.TestCase):
         with self.assertRaises(ConversionError):
             to_month_day("0001")  # Invalid month (0)
 
+        with self.assertRaises(ConversionError):
+            to_month_day("11 5")  # Non-digit
+
+        with self.assertRaises(ConversionError):
+            to_month_day("111")  # Too short
+
 
 class TestConvertValue(unittest.TestCase):
     """Test generic convert_value function."""
@@ -332,6 +356,43 @@ class TestConvertValue(unittest.TestCase):
         with self.assertRaises(ConversionError):
             convert_value("20231301", "DATE")  # Invalid date
 
+    def test_convert_value_propagates_converter_error(self):
+        """Test that converter errors are raised as-is, not re-wrapped."""
+        with self.assertRaises(ConversionError) as ctx:
+            convert_value("202311", "DATE")
+        self.assertIn("Invalid date format", str(ctx.exception))
+        self.assertNotIn("Conversion failed", str(ctx.exception))
+
+
+class TestConverterCache(unittest.TestCase):
+    """Test memoization of date/time/month-day converters."""
+
+    def setUp(self):
+        clear_converter_caches()
+
+    def tearDown(self):
+        clear_converter_caches()
+
+    def test_repeated_values_return_cached_result(self):
+        """Test that repeated raw values reuse the converted object."""
+        first = to_time("1530")
+        self.assertIs(to_time("1530"), first)
+        self.assertIsNone(to_date("00000000"))
+        self.assertIsNone(to_date("00000000"))
+        self.assertEqual(to_month_day("1115"), 1115)
+
+    def test_invalid_values_still_raise(self):
+        """Test that conversion errors are raised on every call."""
+        for _ in range(2):
+            with self.assertRaises(ConversionError):
+                to_date("20231301")
+
+    def test_clear_converter_caches(self):
+        """Test that clearing the caches forces reconversion."""
+        first = to_time("1530")
+        clear_converter_caches()
+        self.assertIsNot(to_time("1530"), first)
+
 
 if __name__ == '__main__':
     unittest.main()
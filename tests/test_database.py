@@ -2,10 +2,12 @@
 
 import tempfile
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.database.schema import SCHEMAS, SchemaManager
+from src.database.base import BaseDatabase, DatabaseError
+from src.database.schema import NL_TABLE_NAMES, RT_TABLE_NAMES, SCHEMAS, SchemaManager
 from src.database.sqlite_handler import SQLiteDatabase
 
 
@@ -120,6 +122,23 @@ class TestSQLiteDatabase:
 
             assert row["name"] == "Alice"
 
+    def test_context_manager_keep_alive(self, db):
+        """Test nested blocks and keep_alive reuse the open connection."""
+        with db:
+            connection = db._connection
+            with db:
+                assert db._connection is connection
+            assert db.is_connected()
+        assert not db.is_connected()
+
+        db.keep_alive = True
+        with db:
+            connection = db._connection
+        assert db.is_connected()
+        with db:
+            assert db._connection is connection
+        db.disconnect()
+
     def test_commit_rollback(self, db):
         """Test commit and rollback."""
         db.connect()
@@ -157,6 +176,66 @@ class TestSQLiteDatabase:
             assert info[1]["name"] == "name"
 
 
+class TestDuckDBDatabase:
+    """Test cases for DuckDB database handler."""
+
+    @pytest.fixture
+    def db(self):
+        """Create DuckDB database instance."""
+        pytest.importorskip("duckdb")
+        from src.database.duckdb_handler import DuckDBDatabase
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield DuckDBDatabase({"path": str(Path(tmpdir) / "test.duckdb")})
+
+    def test_insert_many_columnar_upsert(self, db):
+        """Test bulk UPSERT with NULLs and duplicate keys in one batch."""
+        with db:
+            db.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name VARCHAR, score INTEGER)")
+            rows = [
+                {"id": i % 80, "name": f"row{i}", "score": None if i % 2 else i}
+                for i in range(100)
+            ]
+
+            assert db.insert_many("t", rows) == 100
+
+            assert db.fetch_one("SELECT COUNT(*) AS c FROM t")["c"] == 80
+            # Later duplicates win, NULLs are stored as NULL
+            assert db.fetch_one("SELECT * FROM t WHERE id = 5") == {
+                "id": 5, "name": "row85", "score": None,
+            }
+
+            db.insert_many("t", [{"id": 5, "name": "again", "score": 1}] * 60)
+            assert db.fetch_one("SELECT name FROM t WHERE id = 5")["name"] == "again"
+
+
+class TestPostgreSQLCopyInsert:
+    """Test cases for the PostgreSQL COPY bulk insert path."""
+
+    def test_insert_many_uses_copy(self):
+        """Test that large batches are streamed with COPY."""
+        from src.database import postgresql_handler
+        from src.database.postgresql_handler import PostgreSQLDatabase
+
+        db = PostgreSQLDatabase({"database": "test"})
+        db._connection = MagicMock()
+        rows = [{"Id": i % 55, "Name": None if i % 2 else f"a\tb{i}"} for i in range(60)]
+
+        with patch.object(postgresql_handler, "DRIVER", "pg8000"), \
+                patch.object(db, "_get_primary_key_columns", return_value=["id"]):
+            assert db.insert_many("t", rows) == 60
+
+        calls = [c for c in db._connection.run.call_args_list]
+        copy_call = next(c for c in calls if c.args[0].startswith("COPY"))
+        lines = copy_call.kwargs["stream"].getvalue().splitlines()
+        # Duplicate keys reduced to the last row; tabs escaped; None as \N
+        assert len(lines) == 55
+        assert "3\ta\\tb58" in lines
+        assert "4\t\\N" in lines
+        assert calls[-1].args[0].startswith("INSERT INTO t (id, name) SELECT id, name FROM")
+        assert "ON CONFLICT (id) DO UPDATE" in calls[-1].args[0]
+
+
 class TestSchemaManager:
     """Test cases for SchemaManager."""
 
@@ -184,6 +263,14 @@ class TestSchemaManager:
         assert "NL_SE" in names
         assert "NL_HR" in names
 
+    def test_table_name_groups(self):
+        """Test the precomputed NL_/RT_ table name groups."""
+        assert "NL_RA" in NL_TABLE_NAMES
+        assert "RT_RA" in RT_TABLE_NAMES
+        assert NL_TABLE_NAMES == tuple(n for n in SCHEMAS if n.startswith("NL_"))
+        assert RT_TABLE_NAMES == tuple(n for n in SCHEMAS if n.startswith("RT_"))
+        assert not set(NL_TABLE_NAMES) & set(RT_TABLE_NAMES)
+
     def test_create_table(self, db, manager):
         """Test creating single table."""
         with db:
@@ -204,6 +291,63 @@ class TestSchemaManager:
             existing = manager.get_existing_tables()
             assert len(existing) == len(SCHEMAS)
 
+    def test_create_tables(self, db, manager):
+        """Test creating several tables in one batch."""
+        with db:
+            results = manager.create_tables(["NL_RA", "NL_SE", "NO_SUCH_TABLE"])
+
+            assert results == {"NL_RA": True, "NL_SE": True, "NO_SUCH_TABLE": False}
+            assert manager.table_exists("NL_RA")
+            assert manager.table_exists("NL_SE")
+
+    def test_create_tables_falls_back_per_table(self, db, manager):
+        """Test that tables are created one by one if the batch fails."""
+        with db:
+            with patch.object(db, "execute_script", side_effect=DatabaseError("boom")):
+                results = manager.create_tables(["NL_RA", "NL_SE"])
+
+            assert results == {"NL_RA": True, "NL_SE": True}
+            assert manager.table_exists("NL_SE")
+
+    def test_create_tables_keeps_error_messages(self, db, manager):
+        """Test that the error of each failed table is kept for reporting."""
+        with db:
+            with patch.object(db, "execute_script", side_effect=DatabaseError("boom")), \
+                    patch.object(db, "execute", side_effect=DatabaseError("disk full")):
+                results = manager.create_tables(["NL_RA", "NO_SUCH_TABLE"])
+
+        assert results == {"NL_RA": False, "NO_SUCH_TABLE": False}
+        assert "disk full" in manager.errors["NL_RA"]
+        assert manager.errors["NO_SUCH_TABLE"] == "unknown table"
+
+    def test_get_missing_tables_cached_until_file_changes(self, db, manager):
+        """Test that missing tables are cached until the database changes."""
+        with db:
+            manager.create_table("NL_RA")
+            missing = manager.get_missing_tables()
+
+            with patch.object(manager, "_find_missing_tables") as find:
+                assert manager.get_missing_tables() == missing
+                find.assert_not_called()
+
+            # A table created outside the manager changes the WAL file
+            db.execute(SCHEMAS["NL_SE"])
+            db.commit()
+            assert "NL_SE" not in manager.get_missing_tables()
+
+    def test_get_missing_tables_not_cached_for_server_databases(self):
+        """Test that PostgreSQL is queried on every call (tables may change elsewhere)."""
+        pg = MagicMock(spec=BaseDatabase)
+        pg.get_db_type.return_value = "postgresql"
+        pg.list_tables.return_value = []
+        manager = SchemaManager(pg)
+
+        manager.get_missing_tables()
+        pg.list_tables.return_value = ["nl_ra"]
+
+        assert "NL_RA" not in manager.get_missing_tables()
+        assert pg.list_tables.call_count == 2
+
     def test_get_missing_tables(self, db, manager):
         """Test getting missing tables."""
         with db:
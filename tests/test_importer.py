@@ -142,6 +142,41 @@ class TestDataImporter:
 
             db.commit()
 
+    def test_background_writes(self, db):
+        """Test batches written on the background writer thread."""
+        importer = DataImporter(
+            db, batch_size=3, background_writes=True, max_pending_batches=2
+        )
+
+        with db:
+            db.execute(SCHEMAS["NL_RA"])
+
+            records = [
+                {
+                    "headRecordSpec": "RA",
+                    "RecordSpec": "RA",
+                    "DataKubun": "1",
+                    "MakeDate": "20240601",
+                    "Year": 2024,
+                    "MonthDay": 601,
+                    "JyoCD": "06",
+                    "Kaiji": 3,
+                    "Nichiji": 8,
+                    "RaceNum": i,
+                    "Hondai": f"レース{i}",
+                    "Kyori": 2000,
+                }
+                for i in range(1, 21)
+            ]
+
+            stats = importer.import_records(iter(records))
+
+            assert stats["records_imported"] == 20
+            assert stats["batches_processed"] == 7
+
+            rows = db.fetch_all("SELECT * FROM NL_RA")
+            assert len(rows) == 20
+
     def test_import_mixed_record_types(self, db, importer):
         """Test importing different record types."""
         with db:
@@ -266,5 +266,70 @@ class TestIndexPerformance(unittest.TestCase):
             )
 
 
+class _FakePostgreSQL:
+    """Minimal PostgreSQL stand-in recording statements from all connections."""
+
+    executed = []
+
+    def __init__(self, config):
+        self.config = config
+
+    def get_db_type(self):
+        return "postgresql"
+
+    def connect(self):
+        pass
+
+    def disconnect(self):
+        pass
+
+    def execute(self, sql):
+        raise AssertionError("main connection should not be used")
+
+    def execute_autocommit(self, sql):
+        self.executed.append(sql)
+
+
+class TestParallelIndexCreation(unittest.TestCase):
+    """Test concurrent index creation on PostgreSQL."""
+
+    def test_create_all_indexes_postgresql(self):
+        """Test that PostgreSQL indexes are built concurrently on worker connections."""
+        _FakePostgreSQL.executed = []
+        index_manager = IndexManager(_FakePostgreSQL({}))
+
+        results = index_manager.create_all_indexes()
+
+        self.assertEqual(list(results), list(INDEXES))
+        for table_name, statements in INDEXES.items():
+            self.assertEqual(results[table_name], len(statements))
+
+        total = sum(len(statements) for statements in INDEXES.values())
+        self.assertEqual(len(_FakePostgreSQL.executed), total)
+        for sql in _FakePostgreSQL.executed:
+            self.assertTrue(sql.startswith("CREATE INDEX CONCURRENTLY IF NOT EXISTS"))
+
+    def test_failed_concurrent_build_drops_invalid_index(self):
+        """Test that a failed concurrent build drops the index it left behind."""
+
+        class _FailingPostgreSQL(_FakePostgreSQL):
+            def execute_autocommit(self, sql):
+                super().execute_autocommit(sql)
+                if "idx_nl_ra_venue ON" in sql:
+                    raise Exception("deadlock detected")
+
+        _FakePostgreSQL.executed = []
+        index_manager = IndexManager(_FailingPostgreSQL({}))
+
+        results = index_manager.create_all_indexes()
+
+        self.assertEqual(results["NL_RA"], len(INDEXES["NL_RA"]) - 1)
+        self.assertIn(
+            "DROP INDEX CONCURRENTLY IF EXISTS idx_nl_ra_venue", _FakePostgreSQL.executed
+        )
+        drops = [sql for sql in _FakePostgreSQL.executed if sql.startswith("DROP")]
+        self.assertEqual(len(drops), 1)
+
+
 if __name__ == '__main__':
     unittest.main()
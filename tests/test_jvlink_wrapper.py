@@ -17,7 +17,7 @@ from src.jvlink.constants import (
     JV_RT_ERROR,
     JV_RT_SUCCESS,
 )
-from src.jvlink.wrapper import JVLinkError, JVLinkWrapper
+from src.jvlink.wrapper import JVLinkError, JVLinkWrapper, _bstr_to_bytes
 
 
 class TestJVLinkWrapper:
@@ -217,6 +217,43 @@ class TestJVLinkWrapper:
         assert buff is None
         assert filename is None
 
+    @patch("src.jvlink.wrapper.win32com")
+    def test_jv_read_after_complete(self, mock_win32com):
+        """Test that reads after completion skip the COM call until reopened."""
+        mock_com = MagicMock()
+        mock_com.JVOpen.return_value = (0, 1, 0, "20241231235959")
+        mock_com.JVRead.return_value = (JV_READ_SUCCESS, "", 0, "")
+        mock_win32com.client.Dispatch.return_value = mock_com
+
+        wrapper = JVLinkWrapper(sid="TEST")
+        wrapper.jv_open("RACE", "20240101000000")
+
+        assert wrapper.jv_read() == (JV_READ_SUCCESS, None, None)
+        assert wrapper.jv_read() == (JV_READ_SUCCESS, None, None)
+        assert mock_com.JVRead.call_count == 1
+
+        wrapper.jv_open("RACE", "20240101000000")
+        wrapper.jv_read()
+        assert mock_com.JVRead.call_count == 2
+
+    @patch("src.jvlink.wrapper.win32com")
+    def test_jv_gets_unpacks_result(self, mock_win32com):
+        """Test JVGets result unpacking and unexpected return shapes."""
+        mock_com = MagicMock()
+        mock_com.JVOpen.return_value = (0, 1, 0, "20241231235959")
+        test_data = "RA1202406010603081"
+        mock_com.JVGets.return_value = (len(test_data), test_data, len(test_data))
+        mock_win32com.client.Dispatch.return_value = mock_com
+
+        wrapper = JVLinkWrapper(sid="TEST")
+        wrapper.jv_open("RACE", "20240101000000")
+
+        assert wrapper.jv_gets() == (len(test_data), test_data.encode("cp932"))
+
+        mock_com.JVGets.return_value = 0
+        with pytest.raises(JVLinkError, match="Unexpected JVGets return format"):
+            wrapper.jv_gets()
+
     @patch("win32com.client.Dispatch")
     def test_jv_read_without_open(self, mock_dispatch):
         """Test JVRead without opening stream."""
@@ -365,3 +402,26 @@ class TestJVLinkError:
         assert "Test error" in str(error)
         assert str(JV_RT_ERROR) in str(error)
         assert error.error_code == JV_RT_ERROR
+
+
+class TestBstrToBytes:
+    """Test cases for BSTR -> Shift-JIS byte recovery."""
+
+    def test_raw_bytes(self):
+        """Test that code points U+0000-U+00FF map 1:1 to bytes."""
+        raw = "株式".encode("cp932")
+        assert _bstr_to_bytes(raw.decode("latin-1")) == raw
+
+    def test_unicode_japanese(self):
+        """Test that proper Unicode Japanese text is encoded as cp932."""
+        assert _bstr_to_bytes("RA東京") == "RA東京".encode("cp932")
+
+    def test_cp1252_characters(self):
+        """Test that CP1252-interpreted bytes are mapped back."""
+        # 0x93 arrives as U+201C; mixed with a non-cp932 character
+        assert _bstr_to_bytes("\u201c\x93\u20ac\ufffd\U0001f600") == b"\x93\x93\x800?"
+
+    def test_mixed_latin1_and_japanese(self):
+        """Test that raw bytes keep their value next to Japanese text."""
+        # U+20AC is not in cp932; U+00B0 must stay raw byte 0xB0, not 0x81 0x8B
+        assert _bstr_to_bytes("\xb0\u20ac馬") == b"\xb0\x80" + "馬".encode("cp932")
@@ -11,6 +11,7 @@ from pathlib import Path
 import yaml
 
 from src.utils.logger import (
+    is_enabled_for,
     setup_logging,
     setup_logging_from_yaml,
     get_rotation_info,
@@ -361,5 +362,19 @@ class TestRotationWithLogging(unittest.TestCase):
             self.assertIn('Application log message', content)
 
 
+class TestIsEnabledFor(unittest.TestCase):
+    """Test the log level guard used on hot paths."""
+
+    def test_is_enabled_for_follows_logger_level(self):
+        """Test that the guard reflects the stdlib logger level."""
+        std_logger = logging.getLogger('jltsql.test.is_enabled_for')
+        std_logger.setLevel(logging.INFO)
+        try:
+            self.assertTrue(is_enabled_for('jltsql.test.is_enabled_for', logging.INFO))
+            self.assertFalse(is_enabled_for('jltsql.test.is_enabled_for', logging.DEBUG))
+        finally:
+            std_logger.setLevel(logging.NOTSET)
+
+
 if __name__ == '__main__':
     unittest.main()
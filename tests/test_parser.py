@@ -1,7 +1,13 @@
 """Unit tests for JV-Data parsers."""
 
+import importlib
+import pkgutil
+import sys
+from unittest.mock import patch
+
 import pytest
 
+import src.parser
 from src.parser.base import BaseParser, FieldDef
 from src.parser.factory import ParserFactory, get_parser_factory
 from src.parser.hr_parser import HRParser
@@ -9,6 +15,28 @@ from src.parser.ra_parser import RAParser
 from src.parser.se_parser import SEParser
 
 
+def _shipped_parsers():
+    """Collect every BaseParser subclass defined in src/parser."""
+    parsers = []
+    for module_info in pkgutil.iter_modules(src.parser.__path__):
+        module = importlib.import_module(f"src.parser.{module_info.name}")
+        for obj in vars(module).values():
+            if (isinstance(obj, type) and issubclass(obj, BaseParser)
+                    and obj is not BaseParser and obj.__module__ == module.__name__):
+                params = {}
+                if obj.record_type == "AV":
+                    # Price (133-143) runs into RecordDelimiter (138); the
+                    # correct AV layout is not available in this tree
+                    params["marks"] = pytest.mark.xfail(
+                        reason="AV Price overlaps RecordDelimiter", strict=True
+                    )
+                parsers.append(pytest.param(obj, **params))
+    return parsers
+
+
+SHIPPED_PARSERS = _shipped_parsers()
+
+
 class TestFieldDef:
     """Test cases for FieldDef class."""
 
@@ -27,6 +55,14 @@ class TestFieldDef:
         assert field.type == "str"
         assert field.description == ""
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_field_def_uses_slots(self):
+        """Test that FieldDef instances carry no per-instance __dict__."""
+        field = FieldDef("field", 5, 3)
+        assert not hasattr(field, "__dict__")
+        with pytest.raises(AttributeError):
+            field.unknown = 1
+
 
 class TestBaseParser:
     """Test cases for BaseParser class."""
@@ -46,6 +82,113 @@ class TestBaseParser:
         with pytest.raises(ValueError):
             InvalidParser()
 
+    def test_field_definitions_resolved_once_per_class(self):
+        """Test that _define_fields runs once and is shared by instances."""
+        calls = []
+
+        class CountingParser(BaseParser):
+            record_type = "ZZ"
+
+            def _define_fields(self):
+                calls.append(1)
+                return [FieldDef("RecordSpec", 0, 2), (3, 1, "DataKubun")]
+
+        first = CountingParser()
+        second = CountingParser()
+
+        assert len(calls) == 1
+        assert first._fields is second._fields
+        assert second.get_field_def("DataKubun").start == 2
+
+    def test_layout_problems_reported_once_per_class(self):
+        """Test that overlapping and duplicate fields are reported at class setup."""
+
+        class BrokenParser(BaseParser):
+            record_type = "ZB"
+
+            def _define_fields(self):
+                return [
+                    FieldDef("RecordSpec", 0, 2),
+                    FieldDef("Price", 2, 10),
+                    FieldDef("Delimiter", 8, 2),
+                    FieldDef("Price", 10, 2),
+                ]
+
+        with patch("src.parser.base.logger") as mock_logger:
+            BrokenParser()
+            BrokenParser()
+
+        messages = [
+            c.args[0] for c in mock_logger.debug.call_args_list
+            if "field layout" in c.args[0]
+        ]
+        assert messages == [
+            "BrokenParser field layout: Delimiter starts at 8, inside Price (2-12)",
+            "BrokenParser field layout: duplicate field name Price",
+        ]
+
+    @pytest.mark.parametrize("parser_class", SHIPPED_PARSERS, ids=lambda c: c.__name__)
+    def test_shipped_parser_layouts(self, parser_class):
+        """Test that no parser in src/parser has overlapping or duplicate fields."""
+        parser = parser_class()
+        assert BaseParser._layout_problems(parser._fields) == []
+
+    def test_parse_uses_byte_offsets(self):
+        """Test that field positions are byte offsets, including Shift_JIS text."""
+
+        class NameParser(BaseParser):
+            record_type = "ZN"
+
+            def _define_fields(self):
+                return [
+                    FieldDef("RecordSpec", 0, 2),
+                    FieldDef("Bamei", 3, 8),
+                    FieldDef("Code", 11, 2),
+                ]
+
+        parser = NameParser()
+        assert parser._struct.size == 13
+
+        record = b"ZN1" + "テスト".encode("cp932").ljust(8) + b"42"
+        data = parser.parse(record)
+        assert data == {"RecordSpec": "ZN", "Bamei": "テスト", "Code": "42"}
+
+        # Truncated records fall back to per-field slicing
+        assert parser.parse(b"ZN1") == {"RecordSpec": "ZN", "Bamei": None, "Code": None}
+
+        # Invalid Shift_JIS bytes are replaced rather than failing the record
+        data = parser.parse(b"ZN1" + b"\x82\xa0\x82".ljust(8) + b"42")
+        assert data["Bamei"] == "\u3042\ufffd"
+        assert data["Code"] == "42"
+
+    def test_parse_applies_precompiled_converters(self):
+        """Test that convert_type and legacy types are resolved per field."""
+
+        class TypedParser(BaseParser):
+            record_type = "ZT"
+
+            def _define_fields(self):
+                return [
+                    FieldDef("RecordSpec", 0, 2),
+                    FieldDef("MakeDate", 2, 8, convert_type="DATE"),
+                    FieldDef("Count", 10, 3, type="int"),
+                    FieldDef("Kyori", 13, 4, convert_type="SMALLINT"),
+                ]
+
+        parser = TypedParser()
+        assert parser._converters[0] is None
+
+        data = parser.parse(b"ZT20240601 12    ")
+        assert data["MakeDate"].isoformat() == "2024-06-01"
+        assert data["Count"] == 12
+        assert data["Kyori"] is None
+
+        # Invalid values are logged and stored as None
+        data = parser.parse(b"ZT20241399abc1200")
+        assert data["MakeDate"] is None
+        assert data["Count"] is None
+        assert data["Kyori"] == 1200
+
 
 class TestRAParser:
     """Test cases for RA (Race) parser."""
@@ -116,6 +259,18 @@ class TestRAParser:
         assert "Hondai" in data  # Race name (main title)
         assert "Kyori" in data
 
+    def test_parse_shift_jis_field(self):
+        """Test that Shift_JIS text fields decode alongside ASCII fields."""
+        parser = RAParser()
+
+        record = b"RA1" + b"20240601" + b"2024" + b"0601" + b"06" + b"03" + b"08" + b"11"
+        record = record.ljust(32) + "東京優駿".encode("cp932").ljust(60)  # Hondai (offset 32)
+        record += b" " * (856 - len(record))
+
+        data = parser.parse(record)
+        assert data["Hondai"] == "東京優駿"
+        assert data["JyoCD"] == "06"
+
 
 class TestSEParser:
     """Test cases for SE (Race-Horse) parser."""
@@ -271,6 +426,26 @@ class TestParserFactory:
         assert data is not None
         assert data["RecordSpec"] == "RA"
 
+    def test_parse_dispatch_cached(self):
+        """Test that record specs are resolved once and then dispatched directly."""
+        factory = ParserFactory()
+
+        record = b"RA1" + b"20240601" + b"2024" + b"0601" + b"06" + b"03" + b"08" + b"11"
+        record += b" " * (856 - len(record))
+
+        factory.parse(record)
+        assert factory._dispatch[b"RA"] is not None
+
+        factory.get_parser = None  # must not be consulted again
+        assert factory.parse(record)["RecordSpec"] == "RA"
+
+    def test_parse_unsupported_spec_cached(self):
+        """Test that unsupported record specs are remembered as misses."""
+        factory = ParserFactory()
+
+        assert factory.parse(b"ZZ" + b" " * 10) is None
+        assert factory._dispatch[b"ZZ"] is None
+
     def test_parse_invalid_record(self):
         """Test parsing invalid record."""
         factory = ParserFactory()
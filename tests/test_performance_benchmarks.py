@@ -24,6 +24,7 @@ import pytest
 from src.database.sqlite_handler import SQLiteDatabase
 from src.database.schema import SchemaManager
 from src.importer.importer import DataImporter
+from src.jvlink.wrapper import CP1252_TO_BYTE, _bstr_to_bytes
 
 
 class PerformanceTestBase(unittest.TestCase):
@@ -383,5 +384,49 @@ class TestScalability(PerformanceTestBase):
         database.disconnect()
 
 
+def _bstr_to_bytes_per_char(buff_str):
+    """Reference per-character BSTR conversion (the former fallback loop)."""
+    result_bytes = bytearray()
+    for c in buff_str:
+        cp = ord(c)
+        if cp <= 0xFF:
+            result_bytes.append(cp)
+        elif cp in CP1252_TO_BYTE:
+            result_bytes.append(CP1252_TO_BYTE[cp])
+        elif cp == 0xFFFD:
+            result_bytes.append(0x30)
+        else:
+            try:
+                result_bytes.extend(c.encode('cp932'))
+            except UnicodeEncodeError:
+                result_bytes.append(0x3F)
+    return bytes(result_bytes)
+
+
+@pytest.mark.slow
+class TestBstrConversionPerformance(PerformanceTestBase):
+    """Benchmark the JVRead/JVGets BSTR -> bytes fallback path."""
+
+    def test_cp1252_fallback_vs_per_char(self):
+        """Compare the codec-based fallback with the per-character loop."""
+        # Raw Shift-JIS bytes ending in a CP1252-interpreted 0x80 (U+20AC is
+        # not in cp932, so the latin-1 and cp932 tiers both fail)
+        raw = ('RA1' + '東京競馬場'.encode('cp932').decode('latin-1') * 50) * 4
+        buff_str = raw + '\u20ac'
+        iterations = 2000
+
+        self.assertEqual(_bstr_to_bytes(buff_str), _bstr_to_bytes_per_char(buff_str))
+
+        _, loop_elapsed = self.measure_time(
+            lambda: [_bstr_to_bytes_per_char(buff_str) for _ in range(iterations)]
+        )
+        _, codec_elapsed = self.measure_time(
+            lambda: [_bstr_to_bytes(buff_str) for _ in range(iterations)]
+        )
+
+        print(f"\nBSTR fallback x{iterations}: per-char {loop_elapsed:.3f}s, "
+              f"codec {codec_elapsed:.3f}s ({loop_elapsed/codec_elapsed:.1f}x)")
+
+
 if __name__ == '__main__':
     unittest.main()
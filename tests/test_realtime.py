@@ -340,7 +340,7 @@ class TestRealtimeMonitor(unittest.TestCase):
 
         # Verify tables were created
         mock_mgr_instance.get_missing_tables.assert_called_once()
-        mock_mgr_instance.create_all_tables.assert_called_once()
+        mock_mgr_instance.create_tables.assert_called_once_with(["NL_RA", "NL_SE"])
 
     def test_add_error(self):
         """Test error tracking."""